@@ -1,28 +1,460 @@
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, NamedTuple
+
 import requests
+from requests.adapters import HTTPAdapter
 from utils.logger import get_logger
 from utils.config import Config
+from api.token_store import TokenStore
+from api.response_cache import ResponseCache, make_cache_key
+from api.rate_limiter import TokenBucket, QuotaTracker, RateLimitError, QuotaExceededError
+from api.credential_pool import Credential, CredentialPool
+from api.retry import RetryPolicy, RETRYABLE_STATUS, parse_retry_after
+from api.circuit_breaker import CircuitBreaker, CircuitOpenError
+from api.cassette import Cassette, CassetteMissError
+from api.singleflight import SingleFlight
+from api.stream_decode import OfferStream
+from api.json_codec import JsonCodec, get_default_codec
+from api.token_manager import TokenManager
+from api.metrics import MetricsSink, NullSink
 
 logger = get_logger(__name__)
 
+# TEST environment endpoints (Self-Service)
+DEFAULT_BASE_URL = "https://test.api.amadeus.com"
+TOKEN_PATH = "/v1/security/oauth2/token"
+SEARCH_PATH = "/v2/shopping/flight-offers"
+CALENDAR_PATH = "/v1/shopping/flight-dates"
+
+TOKEN_URL = DEFAULT_BASE_URL + TOKEN_PATH
+SEARCH_URL = DEFAULT_BASE_URL + SEARCH_PATH
+
+# Brotli is only advertised when a decoder is installed for requests/httpx
+try:
+    import brotli  # noqa: F401
+    ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    ACCEPT_ENCODING = "gzip, deflate"
+
+
+def resolve_base_url(base_url=None):
+    """
+    Explicit base_url, else Config.AMADEUS_BASE_URL (e.g. a local
+    mock_amadeus_server), else the Amadeus test environment.
+    """
+    base_url = base_url or getattr(Config, "AMADEUS_BASE_URL", None) or DEFAULT_BASE_URL
+    return base_url.rstrip("/")
+
+
+# Keep-alive connections per host; matches the default batch concurrency
+POOL_SIZE = 16
 
-class AmadeusClient:
+
+class SearchQuery(NamedTuple):
+    """
+    One route/date/passenger search, as accepted by search_many().
+    """
+    origin: str
+    destination: str
+    date: str
+    adults: int = 2
+    children: int = 2
+    return_date: str = None
+
+
+def build_search_params(origin, destination, date, adults=2, children=2, max_results=50,
+                        return_date=None):
+    """
+    Query parameters for a one-way (or, with return_date, round-trip)
+    Flight Offers Search. Shared by the sync and async clients.
+    """
+    params = {
+        "originLocationCode": origin,
+        "destinationLocationCode": destination,
+        "departureDate": date,
+        "adults": adults,
+        "children": children,
+        "currencyCode": "CAD",
+        "max": max_results
+    }
+    if return_date:
+        params["returnDate"] = return_date
+    return params
+
+
+def build_multi_city_body(legs, adults=2, children=2, max_results=50):
+    """
+    POST body for a multi-city Flight Offers Search.
+    legs = [(origin, destination, date), ...] in travel order.
+    """
+    travelers = [{"id": str(i + 1), "travelerType": "ADULT"} for i in range(adults)]
+    travelers += [
+        {"id": str(adults + i + 1), "travelerType": "CHILD"} for i in range(children)
+    ]
+
+    return {
+        "currencyCode": "CAD",
+        "originDestinations": [
+            {
+                "id": str(i + 1),
+                "originLocationCode": origin,
+                "destinationLocationCode": destination,
+                "departureDateTimeRange": {"date": date},
+            }
+            for i, (origin, destination, date) in enumerate(legs)
+        ],
+        "travelers": travelers,
+        "sources": ["GDS"],
+        "searchCriteria": {"maxFlightOffers": max_results},
+    }
+
+
+# Retry-loop steps decided by BaseAmadeusClient._next_step
+REFRESH = "refresh"     # 401: refresh this key's token, then resend
+FAILOVER = "failover"   # 429 with another key ready: resend right away
+RETRY = "retry"         # sleep for the returned delay, then resend
+DONE = "done"           # return the response (success or final failure)
+
+
+class BaseAmadeusClient:
+    """
+    Everything AmadeusClient and AsyncAmadeusClient share: configuration,
+    credential and quota bookkeeping, cache / cassette handling and every
+    decision the retry loop makes (status classification, failover,
+    backoff). Subclasses only do the I/O: sending, sleeping and token
+    refreshes, blocking or awaitable.
+    """
+
+    def __init__(self, token_manager_cls, inflight,
+                 token_store: TokenStore = None, cache: ResponseCache = None,
+                 rate_limiter: TokenBucket = None, quota: QuotaTracker = None,
+                 retry_policy: RetryPolicy = None, circuit_breaker: CircuitBreaker = None,
+                 base_url: str = None, cassette: Cassette = None,
+                 codec: JsonCodec = None, credentials: List[Credential] = None,
+                 metrics: MetricsSink = None):
+        # Each key brings its own token, rate limiter and quota counter
+        credentials = credentials or [
+            Credential(Config.AMADEUS_API_KEY, Config.AMADEUS_API_SECRET, rate_limiter)
+        ]
+        self.credentials = CredentialPool(credentials)
+
+        # Primary key, kept for single-key callers
+        self.api_key = credentials[0].api_key
+        self.api_secret = credentials[0].api_secret
+
+        self.base_url = resolve_base_url(base_url)
+        self.token_url = self.base_url + TOKEN_PATH
+        self.search_url = self.base_url + SEARCH_PATH
+
+        # Tokens persist on disk so new processes can skip the auth round trip
+        token_store = token_store or TokenStore()
+        for credential in self.credentials:
+            credential.tokens = token_manager_cls(
+                lambda credential=credential: self._request_token(credential),
+                store=token_store,
+                store_key=TokenStore.key_for(credential.api_key, self.token_url),
+            )
+            credential.quota_key = self._quota_key(credential, SEARCH_PATH)
+
+        self.tokens = credentials[0].tokens
+
+        self.cache = cache
+
+        # Client-side throttling: stay under TPS and never blow the quota
+        self.rate_limiter = credentials[0].rate_limiter
+        self.quota = quota or QuotaTracker.from_config()
+        self.quota_key = credentials[0].quota_key
+
+        self.retry_policy = retry_policy or RetryPolicy()
+
+        # Fail fast while the search endpoint is degraded
+        self.breaker = circuit_breaker or CircuitBreaker()
+
+        # Fastest installed JSON decoder (orjson / msgspec / stdlib)
+        self.codec = codec or get_default_codec()
+
+        # Phase latencies, payload sizes, statuses, retries and cache hits
+        self.metrics = metrics or NullSink()
+
+        # Record/replay of raw responses for deterministic runs
+        self.cassette = cassette
+
+        # Identical searches in flight at the same time share one HTTP call
+        self._inflight = inflight
+
+    @property
+    def access_token(self):
+        return self.tokens.access_token
+
+    @property
+    def quota_low(self) -> bool:
+        """
+        True when every key's remaining quota is nearly used up — back off.
+        """
+        return all(self.quota.is_low(c.quota_key) for c in self.credentials)
+
+    # ---------------------------------------------------------
+    # CREDENTIALS
+    # ---------------------------------------------------------
+    def _quota_key(self, credential: Credential, path: str) -> str:
+        # Amadeus meters each API separately
+        return TokenStore.key_for(credential.api_key, self.base_url + path)
+
+    def _reserve_credential(self, path=SEARCH_PATH):
+        """
+        Picks the healthiest key and counts the call against its quota for
+        `path`. Keys out of quota are skipped; raises QuotaExceededError
+        once every key is used up. Returns (credential, seconds to wait for
+        its rate limiter) so the caller can sleep or await.
+        """
+        while True:
+            credential = self.credentials.acquire()
+            try:
+                remaining = self.quota.consume(self._quota_key(credential, path))
+            except QuotaExceededError:
+                self.credentials.mark_exhausted(credential)
+                continue
+
+            credential.quota_left = self.quota.fraction_left(remaining)
+            return credential, credential.rate_limiter.reserve()
+
+    # ---------------------------------------------------------
+    # RETRY LOOP DECISIONS
+    # ---------------------------------------------------------
+    def _allow_attempt(self, attempt, tags) -> bool:
+        """
+        Asks the breaker before each attempt. Raises CircuitOpenError if
+        it refuses the first one; False means stop retrying.
+        """
+        if self.breaker.allow_request():
+            return True
+        if attempt == 0:
+            self.metrics.increment("amadeus.circuit_rejected", tags=tags)
+            raise CircuitOpenError("Amadeus search circuit is open")
+        logger.error("Amadeus circuit opened — abandoning retries")
+        self.metrics.observe("amadeus.attempts", attempt, tags)
+        return False
+
+    @staticmethod
+    def _search_headers(token, post=False):
+        headers = {
+            "Authorization": f"Bearer {token}",
+            "Accept": "application/vnd.amadeus+json, application/json",
+            "Accept-Encoding": ACCEPT_ENCODING,
+        }
+        if post:
+            headers["Content-Type"] = "application/vnd.amadeus+json"
+            headers["X-HTTP-Method-Override"] = "GET"
+        return headers
+
+    def _record_outcome(self, response, latency):
+        """
+        5xx counts against the circuit; anything else proves the endpoint
+        is up (slow calls are still counted as failures by the breaker).
+        """
+        if response.status_code >= 500:
+            self.breaker.record_failure()
+        else:
+            self.breaker.record_success(latency)
+
+    def _record_error(self, error, tags):
+        self.breaker.record_failure()
+        self.metrics.increment("amadeus.responses", tags=dict(tags, status=type(error).__name__))
+
+    def _next_step(self, attempt, deadline, credential, response, error, refreshed, tags):
+        """
+        What to do after an attempt: (REFRESH | FAILOVER | RETRY | DONE, delay).
+        - 401 → refresh that key's token once and resend
+        - 429 → fail over to another key, or wait for Retry-After
+        - 5xx / connection errors → jittered backoff
+        - stops when attempts or the time budget run out
+        """
+        policy = self.retry_policy
+
+        if response is not None and response.status_code == 401 and credential not in refreshed:
+            logger.warning("Token expired — refreshing...")
+            refreshed.add(credential)
+            return REFRESH, 0.0
+
+        if response is not None and response.status_code not in RETRYABLE_STATUS:
+            self.credentials.mark_success(credential)
+            self.metrics.observe("amadeus.attempts", attempt, tags)
+            return DONE, 0.0
+
+        retry_after = None
+        if response is not None and response.status_code == 429:
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            self.credentials.mark_throttled(credential, retry_after)
+
+            # Another key can take it right away
+            if attempt < policy.max_attempts and self.credentials.has_ready(exclude=credential):
+                return FAILOVER, 0.0
+
+        delay = policy.next_delay(attempt, deadline, retry_after)
+        reason = error if response is None else f"HTTP {response.status_code}"
+
+        if delay is None:
+            logger.error(f"Amadeus search gave up after {attempt} attempts: {reason}")
+            self.metrics.observe("amadeus.attempts", attempt, tags)
+            return DONE, 0.0
+
+        logger.warning(f"Amadeus search failed ({reason}), retrying in {delay:.1f}s")
+        self.metrics.increment("amadeus.retries", tags=tags)
+        return RETRY, delay
+
+    # ---------------------------------------------------------
+    # CACHE / CASSETTE / RESPONSES
+    # ---------------------------------------------------------
+    def _lookup(self, cache_key, path, params):
+        """
+        Cached or recorded result for a search, without touching the
+        network. Returns (raw or None, replayed).
+
+        The cassette goes first, so a replay is never shadowed by live
+        data sitting in the response cache (and a replay miss raises
+        CassetteMissError). Cache hits are written to a recording
+        cassette too, so a record run captures every search it served.
+        """
+        # Keyed by path, not host, so recordings replay against any base_url
+        cassette_key = make_cache_key(path, params)
+
+        if self.cassette is not None:
+            recorded = self.cassette.play(cassette_key)
+            if recorded is not None:
+                self.metrics.increment("amadeus.cassette", tags={"result": "hit"})
+                return recorded, True
+
+        if self.cache is not None:
+            cached = self.cache.get(cache_key)
+            self.metrics.increment("amadeus.cache", tags={"result": "miss" if cached is None else "hit"})
+            if cached is not None:
+                if self.cassette is not None:
+                    self.cassette.record(cassette_key, self.base_url + path, params, cached)
+                return cached, False
+
+        return None, False
+
+    def _serve_stale(self, cache_key):
+        """
+        Upstream is down: an expired quote if we still have one.
+        """
+        stale = None
+        if self.cache is not None:
+            stale = self.cache.get(cache_key, allow_stale=True)
+        if stale is not None:
+            logger.warning("Amadeus circuit open — serving stale cached offers")
+            self.metrics.increment("amadeus.cache", tags={"result": "stale"})
+        else:
+            logger.warning("Amadeus circuit open — failing fast")
+        return stale
+
+    def _finish_fetch(self, response, started, cache_key, path, params):
+        """
+        Decodes a search response, caching and recording a successful one.
+        Returns the payload, or None on failure.
+        """
+        if response is None:
+            return None
+
+        if response.status_code != 200:
+            logger.error(f"Amadeus search failed: {response.text}")
+            return None
+
+        tags = {"endpoint": path}
+        body = response.content
+        decode_started = time.perf_counter()
+        raw = self.codec.loads(body)
+        finished = time.perf_counter()
+
+        self.metrics.observe("amadeus.latency", finished - decode_started, dict(tags, phase="decode"))
+        self.metrics.observe("amadeus.latency", finished - started, dict(tags, phase="total"))
+        self.metrics.observe("amadeus.payload_bytes", len(body), tags)
+
+        if self.cache is not None and "errors" not in raw:
+            self.cache.set(cache_key, raw)
+
+        if self.cassette is not None:
+            self.cassette.record(make_cache_key(path, params), self.base_url + path, params, raw)
+
+        return raw
+
+    # ---------------------------------------------------------
+    # REQUESTS
+    # ---------------------------------------------------------
+    def _offers_request(self, origin, destination, date, adults, children, return_date):
+        params = build_search_params(origin, destination, date, adults, children,
+                                     return_date=return_date)
+        return params, make_cache_key(self.search_url, params)
+
+    @staticmethod
+    def _log_search(origin, destination, date, return_date=None):
+        trip = f"{date}, returning {return_date}" if return_date else date
+        logger.info(f"Searching flights for {origin} -> {destination} on {trip}")
+
+    def _calendar_request(self, origin, destination, start_date, end_date):
+        params = {
+            "origin": origin,
+            "destination": destination,
+            "departureDate": f"{start_date},{end_date}",
+            "oneWay": "true",
+            "viewBy": "DATE",
+        }
+        return params, make_cache_key(self.base_url + CALENDAR_PATH, params)
+
+    @staticmethod
+    def _parse_calendar(raw):
+        if not raw or "errors" in raw:
+            return None
+
+        calendar = {}
+        for entry in raw.get("data", []):
+            try:
+                calendar[entry["departureDate"]] = float(entry["price"]["total"])
+            except (KeyError, TypeError, ValueError):
+                continue
+        return calendar
+
+
+class AmadeusClient(BaseAmadeusClient):
     """
     Production-ready Amadeus API client.
     Handles:
     - OAuth token generation
-    - Automatic token refresh
-    - Flight Offers Search
+    - Proactive token refresh before expiry (single-flight)
+    - Token reuse across processes via TokenStore
+    - Optional TTL response cache (memory LRU + disk)
+    - Token-bucket rate limiting and per-key daily/monthly quota
+    - Multi-key credential pool with health/quota-aware routing and failover
+    - Retries with jittered backoff on 429 / 5xx / connection errors
+    - Single-flight dedup of identical concurrent searches
+    - Circuit breaker that fails fast (or serves stale cache) when degraded
+    - Cassette record/replay for deterministic offline runs
+    - Compressed transfer (gzip/deflate, br when available) + fast JSON decode
+    - Pooled keep-alive session and batched multi-route search (search_many)
+    - Per-request latency / payload / retry / cache metrics via a MetricsSink
+    - Flight Offers Search: one-way, round-trip and multi-city
     """
 
-    def __init__(self):
-        self.api_key = Config.AMADEUS_API_KEY
-        self.api_secret = Config.AMADEUS_API_SECRET
+    def __init__(self, token_store: TokenStore = None, cache: ResponseCache = None,
+                 rate_limiter: TokenBucket = None, quota: QuotaTracker = None,
+                 retry_policy: RetryPolicy = None, circuit_breaker: CircuitBreaker = None,
+                 base_url: str = None, cassette: Cassette = None,
+                 codec: JsonCodec = None, pool_size: int = POOL_SIZE,
+                 credentials: List[Credential] = None, metrics: MetricsSink = None):
+        super().__init__(
+            TokenManager, SingleFlight(),
+            token_store=token_store, cache=cache, rate_limiter=rate_limiter, quota=quota,
+            retry_policy=retry_policy, circuit_breaker=circuit_breaker, base_url=base_url,
+            cassette=cassette, codec=codec, credentials=credentials, metrics=metrics,
+        )
 
-        # TEST environment endpoints (Self-Service)
-        self.token_url = "https://test.api.amadeus.com/v1/security/oauth2/token"
-        self.search_url = "https://test.api.amadeus.com/v2/shopping/flight-offers"
-
-        self.access_token = None
+        # One pooled keep-alive session shared by every thread
+        self.pool_size = pool_size
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
 
     # ---------------------------------------------------------
     # AUTHENTICATION
@@ -30,66 +462,300 @@ class AmadeusClient:
     def authenticate(self):
         """
         Generates a fresh OAuth access token.
+        Concurrent callers share a single token request.
+        """
+        return self.tokens.refresh(stale=self.tokens.access_token)
+
+    def _request_token(self, credential: Credential):
+        """
+        Calls the OAuth endpoint. Returns (access_token, expires_in).
         """
         logger.info("Authenticating with Amadeus...")
 
         data = {
             "grant_type": "client_credentials",
-            "client_id": self.api_key,
-            "client_secret": self.api_secret
+            "client_id": credential.api_key,
+            "client_secret": credential.api_secret
         }
 
-        response = requests.post(self.token_url, data=data)
+        response = self.session.post(self.token_url, data=data)
 
         if response.status_code != 200:
             logger.error(f"Amadeus OAuth failed: {response.text}")
             raise Exception("Failed to authenticate with Amadeus")
 
-        self.access_token = response.json()["access_token"]
+        payload = self.codec.loads(response.content)
         logger.info("Amadeus authentication successful")
+        return payload["access_token"], payload.get("expires_in")
+
+    def _acquire_credential(self, path=SEARCH_PATH) -> Credential:
+        """
+        Picks the healthiest key (see _reserve_credential) and waits for
+        its rate limiter.
+        """
+        started = time.perf_counter()
+        credential, wait = self._reserve_credential(path)
+        if wait > 0:
+            time.sleep(wait)
+        self.metrics.observe("amadeus.latency", time.perf_counter() - started, {"phase": "throttle"})
+        return credential
+
+    def _send_search(self, params, stream=False, path=SEARCH_PATH, post=False):
+        """
+        GETs a shopping endpoint (flight-offers by default) under the retry
+        policy (see _next_step). post=True sends `params` as a JSON body
+        instead, for multi-city.
+        Returns the last response, or None if no response was ever received.
+        """
+        policy = self.retry_policy
+        deadline = policy.deadline()
+        tags = {"endpoint": path}
+
+        refreshed = set()
+        attempt = 0
+        response = None
+
+        while True:
+            if not self._allow_attempt(attempt, tags):
+                return response
+
+            try:
+                credential = self._acquire_credential(path)
+                # Valid token, refreshed ahead of expiry if needed
+                token = credential.tokens.get_token()
+            except Exception:
+                self.breaker.release()
+                raise
+
+            headers = self._search_headers(token, post)
+            request = {"data": self.codec.dumps(params)} if post else {"params": params}
+
+            attempt += 1
+            started = time.monotonic()
+            try:
+                response = (self.session.post if post else self.session.get)(
+                    self.base_url + path,
+                    headers=headers,
+                    timeout=policy.timeout_for(deadline),
+                    stream=stream,
+                    **request,
+                )
+            except requests.RequestException as e:
+                # Connection errors, timeouts, and bodies cut off mid-read
+                # (ChunkedEncodingError, ContentDecodingError)
+                response = None
+                error = e
+                self._record_error(e, tags)
+            except Exception:
+                # Never keep a half-open probe slot claimed
+                self.breaker.release()
+                raise
+            else:
+                error = None
+                elapsed = time.monotonic() - started
+                self._record_outcome(response, elapsed)
+                self._record_timing(response, elapsed, stream, tags)
+
+            step, delay = self._next_step(attempt, deadline, credential, response, error, refreshed, tags)
+            if step == DONE:
+                return response
+
+            # Discarded response: with stream=True its body is still unread
+            if stream and response is not None:
+                self._release(response)
+
+            if step == REFRESH:
+                credential.tokens.refresh(stale=token)
+            elif step == RETRY:
+                time.sleep(delay)
+
+    @staticmethod
+    def _release(response):
+        """
+        Reads a streamed error response's (small) body, which returns its
+        connection to the pool and keeps .text usable should the response
+        still be returned, then closes it.
+        """
+        try:
+            response.content
+        except requests.RequestException:
+            pass
+        finally:
+            response.close()
+
+    def _record_timing(self, response, elapsed, stream, tags):
+        """
+        Per-attempt status and latency split. requests only exposes the time
+        to response headers (`elapsed`: connect + TLS on a new connection,
+        plus server time); the rest of session.get() is the body download.
+        """
+        self.metrics.increment("amadeus.responses", tags=dict(tags, status=str(response.status_code)))
+
+        ttfb = response.elapsed.total_seconds()
+        self.metrics.observe("amadeus.latency", ttfb, dict(tags, phase="ttfb"))
+        if not stream:
+            self.metrics.observe("amadeus.latency", max(0.0, elapsed - ttfb), dict(tags, phase="download"))
+
+        # Compressed size on the wire, when the server declares it
+        wire_bytes = response.headers.get("Content-Length")
+        if wire_bytes and wire_bytes.isdigit():
+            self.metrics.observe("amadeus.wire_bytes", int(wire_bytes), tags)
 
     # ---------------------------------------------------------
     # FLIGHT SEARCH
     # ---------------------------------------------------------
-    def search_flights(self, origin, destination, date, adults=2, children=2):
+    def _cached(self, cache_key, path, params):
+        raw, replayed = self._lookup(cache_key, path, params)
+        if replayed and self.cassette.latency > 0:
+            time.sleep(self.cassette.latency)
+        return raw
+
+    def search_flights(self, origin, destination, date, adults=2, children=2, return_date=None):
         """
         Calls Amadeus Flight Offers Search API.
+        Pass return_date for a round trip: one call returns both legs.
         Automatically refreshes token if expired.
+        Serves fresh results from the response cache when one is configured,
+        and shares one request between identical concurrent searches.
         """
+        params, cache_key = self._offers_request(origin, destination, date, adults, children, return_date)
 
-        # Ensure we have a token
-        if not self.access_token:
-            self.authenticate()
+        cached = self._cached(cache_key, SEARCH_PATH, params)
+        if cached is not None:
+            logger.debug(f"Cache hit for {origin} -> {destination} on {date}")
+            return cached
 
-        headers = {
-            "Authorization": f"Bearer {self.access_token}"
-        }
+        self._log_search(origin, destination, date, return_date)
+        return self._inflight.do(cache_key, lambda: self._fetch_offers(params, cache_key))
 
-        params = {
-            "originLocationCode": origin,
-            "destinationLocationCode": destination,
-            "departureDate": date,
-            "adults": adults,
-            "children": children,
-            "currencyCode": "CAD",
-            "max": 50
-        }
+    def search_multi_city(self, legs, adults=2, children=2, max_results=50):
+        """
+        Calls Amadeus Flight Offers Search (POST) for a multi-city trip.
+        legs = [(origin, destination, date), ...]; each offer in the
+        response carries one itinerary per leg. Cached like search_flights.
+        """
+        body = build_multi_city_body(legs, adults, children, max_results)
+        cache_key = make_cache_key(self.search_url, body)
 
-        logger.info(f"Searching flights for {origin} -> {destination} on {date}")
+        cached = self._cached(cache_key, SEARCH_PATH, body)
+        if cached is not None:
+            return cached
 
+        route = " / ".join(f"{o} -> {d} on {day}" for o, d, day in legs)
+        logger.info(f"Searching multi-city flights: {route}")
 
-        response = requests.get(self.search_url, headers=headers, params=params)
+        return self._inflight.do(cache_key, lambda: self._fetch_offers(body, cache_key, post=True))
 
-        # If token expired, refresh and retry once
-        if response.status_code == 401:
-            logger.warning("Token expired — refreshing...")
-            self.authenticate()
+    def _fetch_offers(self, params, cache_key, path=SEARCH_PATH, post=False):
+        """
+        Sends one search and caches a successful result.
+        Runs at most once per cache_key at a time (see _inflight).
+        """
+        started = time.perf_counter()
+        try:
+            response = self._send_search(params, path=path, post=post)
+        except CircuitOpenError:
+            return self._serve_stale(cache_key)
+
+        return self._finish_fetch(response, started, cache_key, path, params)
+
+    def cached_search(self, origin, destination, date, adults=2, children=2, allow_stale=False,
+                      return_date=None):
+        """
+        Returns a fresh cached search result without touching the network,
+        or None if there is no cache or no fresh entry.
+        allow_stale=True also accepts expired entries still in the stale window.
+        Always None while a cassette is active: search_flights then serves
+        the recording (or records the cache hit) instead of live cache data.
+        """
+        if self.cache is None or self.cassette is not None:
+            return None
+
+        params = build_search_params(origin, destination, date, adults, children,
+                                     return_date=return_date)
+        return self.cache.get(make_cache_key(self.search_url, params), allow_stale=allow_stale)
+
+    # ---------------------------------------------------------
+    # CHEAPEST-DATE CALENDAR
+    # ---------------------------------------------------------
+    def search_cheapest_dates(self, origin, destination, start_date, end_date):
+        """
+        Calls Amadeus Flight Cheapest Date Search for a departure window.
+        One cheap call ranks the whole window before any full offer search.
+        Returns {date: cheapest one-way price}, or None if unavailable
+        (the endpoint only covers routes Amadeus has cached).
+        """
+        params, cache_key = self._calendar_request(origin, destination, start_date, end_date)
+
+        raw = self._cached(cache_key, CALENDAR_PATH, params)
+        if raw is None:
+            logger.info(f"Fetching cheapest-date calendar for {origin} -> {destination} ({start_date} to {end_date})")
+            raw = self._inflight.do(
+                cache_key, lambda: self._fetch_offers(params, cache_key, path=CALENDAR_PATH)
+            )
+
+        return self._parse_calendar(raw)
+
+    # ---------------------------------------------------------
+    # BATCH SEARCH
+    # ---------------------------------------------------------
+    def search_many(self, queries, max_workers: int = None):
+        """
+        Runs many route/date/passenger searches concurrently and yields
+        (query, raw) pairs as each one completes (not in input order).
+
+        Every search still goes through the cache, single-flight, rate
+        limiter and breaker, and shares the pooled session. A query that
+        hits the quota, has no recording in a replay cassette, or still
+        fails at the network level after its retries (connection dropped
+        mid-body, token endpoint down) yields None rather than aborting
+        the batch.
+        """
+        queries = [q if isinstance(q, SearchQuery) else SearchQuery(*q) for q in queries]
+        if not queries:
+            return
 
-            headers["Authorization"] = f"Bearer {self.access_token}"
-            response = requests.get(self.search_url, headers=headers, params=params)
+        def run(query):
+            try:
+                return self.search_flights(*query)
+            except (RateLimitError, CassetteMissError, requests.RequestException) as e:
+                logger.warning(f"Skipping {query}: {e}")
+                return None
+
+        workers = max(1, min(max_workers or self.pool_size, len(queries)))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            futures = {pool.submit(run, query): query for query in queries}
+            for future in as_completed(futures):
+                yield futures[future], future.result()
+
+    # ---------------------------------------------------------
+    # STREAMING SEARCH
+    # ---------------------------------------------------------
+    def search_flights_stream(self, origin, destination, date, adults=2, children=2,
+                              max_results=250, chunk_size=64 * 1024):
+        """
+        Like search_flights, but returns an OfferStream that yields offers
+        as the body downloads instead of materialising the whole payload.
+        Meant for large `max_results`; bypasses the cache and cassette.
+        Returns None if the search failed. Use the stream as a context
+        manager if it may not be read to the end.
+        """
+        params = build_search_params(origin, destination, date, adults, children, max_results)
+
+        logger.info(f"Streaming flights for {origin} -> {destination} on {date}")
+
+        try:
+            response = self._send_search(params, stream=True)
+        except CircuitOpenError:
+            logger.warning("Amadeus circuit open — failing fast")
+            return None
+
+        if response is None:
+            return None
 
         if response.status_code != 200:
             logger.error(f"Amadeus search failed: {response.text}")
+            response.close()
             return None
 
-        return response.json()
+        return OfferStream(response.iter_content(chunk_size=chunk_size), on_close=response.close)
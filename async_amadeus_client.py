@@ -0,0 +1,320 @@
+import asyncio
+import time
+from typing import List
+
+import httpx
+from utils.logger import get_logger
+from api.amadeus_client import (
+    BaseAmadeusClient,
+    CALENDAR_PATH,
+    DONE,
+    REFRESH,
+    RETRY,
+    SEARCH_PATH,
+    SearchQuery,
+    build_multi_city_body,
+)
+from api.token_store import TokenStore
+from api.response_cache import ResponseCache, make_cache_key
+from api.rate_limiter import TokenBucket, QuotaTracker, RateLimitError
+from api.credential_pool import Credential
+from api.retry import RetryPolicy
+from api.circuit_breaker import CircuitBreaker, CircuitOpenError
+from api.cassette import Cassette, CassetteMissError
+from api.singleflight import AsyncSingleFlight
+from api.json_codec import JsonCodec
+from api.token_manager import AsyncTokenManager
+from api.metrics import MetricsSink, TracePhases
+
+logger = get_logger(__name__)
+
+MAX_CONNECTIONS = 100
+MAX_KEEPALIVE_CONNECTIONS = 20
+REQUEST_TIMEOUT = 30.0
+
+
+class AsyncAmadeusClient(BaseAmadeusClient):
+    """
+    Asyncio Amadeus API client.
+    Same surface as AmadeusClient (authenticate / search_flights /
+    search_multi_city / search_cheapest_dates), but every call goes
+    through one pooled keep-alive httpx session, so hundreds of searches
+    can be in flight without a new TCP+TLS handshake per request. Retry,
+    failover, caching and cassette decisions are shared with AmadeusClient
+    (BaseAmadeusClient). Metrics split each request into connect / tls /
+    server / download via httpx tracing.
+
+    Usage:
+        async with AsyncAmadeusClient() as client:
+            raw = await client.search_flights("YYZ", "MAA", "2026-03-20")
+    """
+
+    def __init__(self, max_connections: int = MAX_CONNECTIONS,
+                 max_keepalive_connections: int = MAX_KEEPALIVE_CONNECTIONS,
+                 timeout: float = REQUEST_TIMEOUT,
+                 token_store: TokenStore = None,
+                 cache: ResponseCache = None,
+                 rate_limiter: TokenBucket = None,
+                 quota: QuotaTracker = None,
+                 retry_policy: RetryPolicy = None,
+                 circuit_breaker: CircuitBreaker = None,
+                 base_url: str = None,
+                 cassette: Cassette = None,
+                 codec: JsonCodec = None,
+                 credentials: List[Credential] = None,
+                 metrics: MetricsSink = None):
+        super().__init__(
+            AsyncTokenManager, AsyncSingleFlight(),
+            token_store=token_store, cache=cache, rate_limiter=rate_limiter, quota=quota,
+            retry_policy=retry_policy, circuit_breaker=circuit_breaker, base_url=base_url,
+            cassette=cassette, codec=codec, credentials=credentials, metrics=metrics,
+        )
+
+        self.session = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+            ),
+            timeout=timeout,
+        )
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def close(self):
+        """
+        Closes the pooled session and its keep-alive connections.
+        """
+        await self.session.aclose()
+
+    # ---------------------------------------------------------
+    # AUTHENTICATION
+    # ---------------------------------------------------------
+    async def authenticate(self):
+        """
+        Generates a fresh OAuth access token.
+        Concurrent callers share a single token request.
+        """
+        return await self.tokens.refresh(stale=self.tokens.access_token)
+
+    async def _request_token(self, credential: Credential):
+        """
+        Calls the OAuth endpoint. Returns (access_token, expires_in).
+        """
+        logger.info("Authenticating with Amadeus...")
+
+        data = {
+            "grant_type": "client_credentials",
+            "client_id": credential.api_key,
+            "client_secret": credential.api_secret
+        }
+
+        response = await self.session.post(self.token_url, data=data)
+
+        if response.status_code != 200:
+            logger.error(f"Amadeus OAuth failed: {response.text}")
+            raise Exception("Failed to authenticate with Amadeus")
+
+        payload = self.codec.loads(response.content)
+        logger.info("Amadeus authentication successful")
+        return payload["access_token"], payload.get("expires_in")
+
+    async def _acquire_credential(self, path=SEARCH_PATH) -> Credential:
+        """
+        Picks the healthiest key (see BaseAmadeusClient._reserve_credential),
+        then waits for its rate limiter without blocking the loop. The
+        quota write is a SQLite transaction, so it runs in a worker thread.
+        """
+        started = time.perf_counter()
+        credential, wait = await asyncio.to_thread(self._reserve_credential, path)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        self.metrics.observe("amadeus.latency", time.perf_counter() - started, {"phase": "throttle"})
+        return credential
+
+    async def _send_search(self, params, path=SEARCH_PATH, post=False):
+        """
+        Sends a search under the retry policy (see AmadeusClient._send_search).
+        Returns the last response, or None if no response was ever received.
+        """
+        policy = self.retry_policy
+        deadline = policy.deadline()
+        tags = {"endpoint": path}
+
+        refreshed = set()
+        attempt = 0
+        response = None
+
+        while True:
+            if not self._allow_attempt(attempt, tags):
+                return response
+
+            try:
+                credential = await self._acquire_credential(path)
+                # Valid token, refreshed ahead of expiry if needed
+                token = await credential.tokens.get_token()
+            except Exception:
+                self.breaker.release()
+                raise
+
+            headers = self._search_headers(token, post)
+            request = {"content": self.codec.dumps(params)} if post else {"params": params}
+
+            attempt += 1
+            trace = TracePhases()
+            started = time.monotonic()
+            try:
+                response = await self.session.request(
+                    "POST" if post else "GET",
+                    self.base_url + path,
+                    headers=headers,
+                    timeout=policy.timeout_for(deadline),
+                    extensions={"trace": trace},
+                    **request,
+                )
+            except httpx.RequestError as e:
+                # Transport errors, timeouts, and bodies that fail to decode
+                response = None
+                error = e
+                self._record_error(e, tags)
+            except Exception:
+                # Never keep a half-open probe slot claimed
+                self.breaker.release()
+                raise
+            else:
+                error = None
+                self._record_outcome(response, time.monotonic() - started)
+                self._record_timing(response, trace, tags)
+
+            step, delay = self._next_step(attempt, deadline, credential, response, error, refreshed, tags)
+            if step == REFRESH:
+                await credential.tokens.refresh(stale=token)
+            elif step == DONE:
+                return response
+            elif step == RETRY:
+                await asyncio.sleep(delay)
+
+    def _record_timing(self, response, trace, tags):
+        """
+        Per-attempt status plus the connect / tls / server / download
+        split captured by the httpx trace hook.
+        """
+        self.metrics.increment("amadeus.responses", tags=dict(tags, status=str(response.status_code)))
+
+        for phase, seconds in trace.durations.items():
+            self.metrics.observe("amadeus.latency", seconds, dict(tags, phase=phase))
+
+        wire_bytes = response.headers.get("Content-Length")
+        if wire_bytes and wire_bytes.isdigit():
+            self.metrics.observe("amadeus.wire_bytes", int(wire_bytes), tags)
+
+    # ---------------------------------------------------------
+    # FLIGHT SEARCH
+    # ---------------------------------------------------------
+    async def _cached(self, cache_key, path, params):
+        # Cache and cassette reads can hit the disk: keep them off the loop
+        raw, replayed = await asyncio.to_thread(self._lookup, cache_key, path, params)
+        if replayed and self.cassette.latency > 0:
+            await asyncio.sleep(self.cassette.latency)
+        return raw
+
+    async def search_flights(self, origin, destination, date, adults=2, children=2, return_date=None):
+        """
+        Calls Amadeus Flight Offers Search API (round trip with return_date).
+        Automatically refreshes token if expired.
+        Serves fresh results from the response cache when one is configured,
+        and shares one request between identical concurrent searches.
+        """
+        params, cache_key = self._offers_request(origin, destination, date, adults, children, return_date)
+
+        cached = await self._cached(cache_key, SEARCH_PATH, params)
+        if cached is not None:
+            logger.debug(f"Cache hit for {origin} -> {destination} on {date}")
+            return cached
+
+        self._log_search(origin, destination, date, return_date)
+        return await self._inflight.do(cache_key, lambda: self._fetch_offers(params, cache_key))
+
+    async def search_multi_city(self, legs, adults=2, children=2, max_results=50):
+        """
+        Multi-city search (see AmadeusClient.search_multi_city).
+        """
+        body = build_multi_city_body(legs, adults, children, max_results)
+        cache_key = make_cache_key(self.search_url, body)
+
+        cached = await self._cached(cache_key, SEARCH_PATH, body)
+        if cached is not None:
+            return cached
+
+        route = " / ".join(f"{o} -> {d} on {day}" for o, d, day in legs)
+        logger.info(f"Searching multi-city flights: {route}")
+
+        return await self._inflight.do(cache_key, lambda: self._fetch_offers(body, cache_key, post=True))
+
+    async def search_cheapest_dates(self, origin, destination, start_date, end_date):
+        """
+        Cheapest-date calendar (see AmadeusClient.search_cheapest_dates).
+        Returns {date: cheapest one-way price}, or None if unavailable.
+        """
+        params, cache_key = self._calendar_request(origin, destination, start_date, end_date)
+
+        raw = await self._cached(cache_key, CALENDAR_PATH, params)
+        if raw is None:
+            logger.info(f"Fetching cheapest-date calendar for {origin} -> {destination} ({start_date} to {end_date})")
+            raw = await self._inflight.do(
+                cache_key, lambda: self._fetch_offers(params, cache_key, path=CALENDAR_PATH)
+            )
+
+        return self._parse_calendar(raw)
+
+    async def _fetch_offers(self, params, cache_key, path=SEARCH_PATH, post=False):
+        """
+        Sends one search and caches a successful result.
+        Runs at most once per cache_key at a time (see _inflight).
+        """
+        started = time.perf_counter()
+        try:
+            response = await self._send_search(params, path=path, post=post)
+        except CircuitOpenError:
+            return await asyncio.to_thread(self._serve_stale, cache_key)
+
+        # Decode + cache/cassette writes
+        return await asyncio.to_thread(self._finish_fetch, response, started, cache_key, path, params)
+
+    async def search_dates(self, origin, destination, dates, adults=2, children=2):
+        """
+        Searches every date concurrently on the shared session.
+        Returns [(date_str, raw), ...] in the same order as `dates`.
+        """
+        if not dates:
+            return []
+
+        results = await asyncio.gather(*(
+            self.search_flights(origin, destination, date_str, adults, children)
+            for date_str in dates
+        ))
+        return list(zip(dates, results))
+
+    async def search_many(self, queries, max_concurrency: int = MAX_KEEPALIVE_CONNECTIONS):
+        """
+        Async counterpart of AmadeusClient.search_many: yields
+        (query, raw) pairs as each search completes, with at most
+        `max_concurrency` requests in flight on the shared session.
+        Failed queries yield None, as in the sync client.
+        """
+        queries = [q if isinstance(q, SearchQuery) else SearchQuery(*q) for q in queries]
+        limit = asyncio.Semaphore(max_concurrency)
+
+        async def run(query):
+            async with limit:
+                try:
+                    return query, await self.search_flights(*query)
+                except (RateLimitError, CassetteMissError, httpx.RequestError) as e:
+                    logger.warning(f"Skipping {query}: {e}")
+                    return query, None
+
+        for next_done in asyncio.as_completed([run(query) for query in queries]):
+            yield await next_done
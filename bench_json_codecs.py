@@ -0,0 +1,86 @@
+"""
+Micro-benchmark: JSON decode speed and gzip savings on flight-offer payloads.
+
+Uses recorded cassettes when available, otherwise synthetic payloads from
+mock_amadeus_server:
+
+    python bench_json_codecs.py --cassettes cassettes --rounds 50
+"""
+
+import argparse
+import gzip
+import os
+import time
+
+from api.cassette import Cassette
+from api.json_codec import StdlibJsonCodec, available_codecs
+from api.mock_amadeus_server import generate_offers
+
+
+def load_payloads(cassette_dir: str, synthetic: int):
+    """
+    Returns raw response bodies as bytes, the way they arrive off the wire.
+    """
+    encoder = StdlibJsonCodec()
+
+    if cassette_dir and os.path.isdir(cassette_dir):
+        bodies = [
+            encoder.dumps(entry["response"])
+            for entry in Cassette(cassette_dir).iter_recordings()
+        ]
+        if bodies:
+            return bodies, f"{len(bodies)} recorded payloads from {cassette_dir}"
+
+    bodies = [
+        encoder.dumps(generate_offers("YYZ", "MAA", f"2026-03-{day:02d}", 2, 2, max_results=250))
+        for day in range(1, synthetic + 1)
+    ]
+    return bodies, f"{len(bodies)} synthetic payloads (max=250)"
+
+
+def bench_decode(codec, bodies, rounds: int) -> float:
+    """
+    Best-of-rounds seconds to decode every body once.
+    """
+    best = float("inf")
+    for _ in range(rounds):
+        started = time.perf_counter()
+        for body in bodies:
+            codec.loads(body)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark JSON codecs on Amadeus payloads")
+    parser.add_argument("--cassettes", default="cassettes")
+    parser.add_argument("--synthetic", type=int, default=12)
+    parser.add_argument("--rounds", type=int, default=20)
+    args = parser.parse_args()
+
+    bodies, source = load_payloads(args.cassettes, args.synthetic)
+    raw_bytes = sum(len(b) for b in bodies)
+    gzip_bytes = sum(len(gzip.compress(b, compresslevel=6)) for b in bodies)
+
+    print(f"Payloads: {source}")
+    print(f"Wire size: {raw_bytes / 1024:.0f} KiB identity, {gzip_bytes / 1024:.0f} KiB gzip "
+          f"({raw_bytes / gzip_bytes:.1f}x smaller)")
+    print()
+
+    baseline = None
+    for name, codec in available_codecs().items():
+        seconds = bench_decode(codec, bodies, args.rounds)
+        per_mb = seconds / (raw_bytes / 1e6) * 1000
+        if name == "json":
+            baseline = seconds
+        print(f"{name:<8} {seconds * 1000:8.2f} ms total  {per_mb:7.2f} ms/MB")
+
+    if baseline:
+        print()
+        for name, codec in available_codecs().items():
+            if name != "json":
+                print(f"{name} is {baseline / bench_decode(codec, bodies, args.rounds):.1f}x faster than json")
+
+
+if __name__ == "__main__":
+    main()
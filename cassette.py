@@ -0,0 +1,95 @@
+import gzip
+import json
+import os
+import tempfile
+from typing import Any, Dict, Iterator, Optional
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+RECORD = "record"
+REPLAY = "replay"
+AUTO = "auto"
+
+CASSETTE_DIR = "cassettes"
+
+
+class CassetteMissError(Exception):
+    """
+    Raised in replay mode when no recording exists for a request.
+    """
+
+
+class Cassette:
+    """
+    Records flight-offer responses to gzip'd JSON files and replays them.
+
+    - record: every live response is written (overwriting older takes)
+    - replay: responses come only from disk; a miss raises CassetteMissError
+    - auto:   replay when a recording exists, otherwise go live and record
+
+    One file per request, named by the request's cache key, holding the
+    request (url + params) alongside the response so recordings can be
+    inspected or re-keyed. Clients sleep `latency` seconds per replay to
+    approximate network timing in benchmarks.
+    """
+
+    def __init__(self, directory: str = CASSETTE_DIR, mode: str = AUTO, latency: float = 0.0):
+        if mode not in (RECORD, REPLAY, AUTO):
+            raise ValueError(f"Unknown cassette mode: {mode}")
+
+        self.directory = directory
+        self.mode = mode
+        self.latency = latency
+        os.makedirs(self.directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json.gz")
+
+    def play(self, key: str) -> Optional[Any]:
+        """
+        Returns the recorded response for `key`, or None if the request
+        should go to the network. Raises CassetteMissError in replay mode.
+        """
+        if self.mode == RECORD:
+            return None
+
+        path = self._path(key)
+        if not os.path.exists(path):
+            if self.mode == REPLAY:
+                raise CassetteMissError(f"No recording for request {key}")
+            return None
+
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            entry = json.load(f)
+
+        return entry["response"]
+
+    def record(self, key: str, url: str, params: Dict[str, Any], response: Any) -> None:
+        if self.mode == REPLAY:
+            return
+
+        path = self._path(key)
+        # Unique temp file per write: concurrent writers of the same key
+        # (e.g. a batch of identical searches) must not share one
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=f"{key}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as raw, gzip.open(raw, "wt", encoding="utf-8") as f:
+                json.dump({"request": {"url": url, "params": params}, "response": response}, f)
+            # Atomic swap so concurrent readers never see a half-written file
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        logger.debug(f"Recorded cassette {path}")
+
+    def iter_recordings(self) -> Iterator[Dict[str, Any]]:
+        """
+        Yields every recording as {"request": {...}, "response": {...}}.
+        """
+        for name in sorted(os.listdir(self.directory)):
+            if not name.endswith(".json.gz"):
+                continue
+            with gzip.open(os.path.join(self.directory, name), "rt", encoding="utf-8") as f:
+                yield json.load(f)
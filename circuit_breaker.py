@@ -0,0 +1,118 @@
+import threading
+import time
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+DEFAULT_FAILURE_THRESHOLD = 5
+DEFAULT_RECOVERY_TIMEOUT = 30.0
+DEFAULT_SLOW_CALL_THRESHOLD = 10.0
+DEFAULT_HALF_OPEN_PROBES = 1
+
+
+class CircuitOpenError(Exception):
+    """
+    Raised when a call is refused because the circuit is open.
+    """
+
+
+class CircuitBreaker:
+    """
+    Consecutive-failure circuit breaker.
+
+    CLOSED    → calls pass; `failure_threshold` failures in a row open it.
+                A call slower than `slow_call_threshold` counts as a failure.
+    OPEN      → calls are refused until `recovery_timeout` has passed.
+    HALF_OPEN → up to `half_open_probes` trial calls; one success closes
+                the circuit, one failure opens it again.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        recovery_timeout: float = DEFAULT_RECOVERY_TIMEOUT,
+        slow_call_threshold: float = DEFAULT_SLOW_CALL_THRESHOLD,
+        half_open_probes: int = DEFAULT_HALF_OPEN_PROBES,
+        name: str = "amadeus",
+        clock=time.monotonic,
+    ):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.slow_call_threshold = slow_call_threshold
+        self.half_open_probes = half_open_probes
+        self.name = name
+        self._clock = clock
+
+        self._state = CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probes_in_flight = 0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            self._maybe_half_open()
+            return self._state
+
+    def allow_request(self) -> bool:
+        """
+        True if a call may go out now. In HALF_OPEN this claims a probe slot,
+        so every allowed call must be followed by record_success/record_failure.
+        """
+        with self._lock:
+            self._maybe_half_open()
+
+            if self._state == CLOSED:
+                return True
+            if self._state == HALF_OPEN and self._probes_in_flight < self.half_open_probes:
+                self._probes_in_flight += 1
+                return True
+            return False
+
+    def release(self) -> None:
+        """
+        Gives back a slot claimed by allow_request() when the call was
+        never sent, so it counts as neither success nor failure.
+        """
+        with self._lock:
+            if self._state == HALF_OPEN:
+                self._probes_in_flight = max(0, self._probes_in_flight - 1)
+
+    def record_success(self, latency: float = 0.0) -> None:
+        if latency > self.slow_call_threshold:
+            self.record_failure()
+            return
+
+        with self._lock:
+            if self._state == HALF_OPEN:
+                logger.info(f"Circuit '{self.name}' closed after successful probe")
+                self._probes_in_flight = max(0, self._probes_in_flight - 1)
+            self._state = CLOSED
+            self._failures = 0
+
+    def record_failure(self) -> None:
+        with self._lock:
+            if self._state == HALF_OPEN:
+                self._probes_in_flight = max(0, self._probes_in_flight - 1)
+                self._open()
+                return
+
+            self._failures += 1
+            if self._state == CLOSED and self._failures >= self.failure_threshold:
+                self._open()
+
+    def _open(self) -> None:
+        logger.warning(f"Circuit '{self.name}' opened — failing fast for {self.recovery_timeout:g}s")
+        self._state = OPEN
+        self._opened_at = self._clock()
+
+    def _maybe_half_open(self) -> None:
+        if self._state == OPEN and self._clock() - self._opened_at >= self.recovery_timeout:
+            self._state = HALF_OPEN
+            self._probes_in_flight = 0
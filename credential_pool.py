@@ -0,0 +1,109 @@
+import threading
+import time
+from typing import List, Optional
+
+from utils.logger import get_logger
+from api.rate_limiter import TokenBucket, QuotaExceededError
+
+logger = get_logger(__name__)
+
+# How long a key whose quota ran out is skipped before being re-checked
+EXHAUSTED_BACKOFF = 15 * 60
+# Used when a 429 carries no Retry-After
+DEFAULT_THROTTLE_SECONDS = 1.0
+
+
+class Credential:
+    """
+    One Amadeus API key with its own rate limiter and health state.
+    The client attaches `tokens` (a TokenManager) and `quota_key`.
+    """
+
+    def __init__(self, api_key: str, api_secret: str, rate_limiter: TokenBucket = None):
+        self.api_key = api_key
+        self.api_secret = api_secret
+        self.rate_limiter = rate_limiter or TokenBucket()
+
+        self.tokens = None
+        self.quota_key = None
+
+        # Health, updated by the pool
+        self.quota_left = 1.0           # fraction of the tightest limit left
+        self.throttled_until = 0.0
+        self.exhausted_until = 0.0
+        self.failures = 0
+
+    def __repr__(self):
+        return f"Credential({str(self.api_key)[:4]}…)"
+
+
+class CredentialPool:
+    """
+    Spreads requests across several API keys.
+
+    acquire() skips keys that are out of quota or cooling down after a 429,
+    then prefers the key with the most rate-limiter tokens banked, then the
+    most quota left, then the fewest recent failures. Throughput therefore
+    scales with the number of keys, and a throttled key fails over to the
+    next one instead of stalling the caller.
+    """
+
+    def __init__(self, credentials: List[Credential], clock=time.monotonic):
+        if not credentials:
+            raise ValueError("CredentialPool needs at least one credential")
+        self.credentials = list(credentials)
+        self._clock = clock
+        self._lock = threading.Lock()
+
+    def __iter__(self):
+        return iter(self.credentials)
+
+    def __len__(self):
+        return len(self.credentials)
+
+    def acquire(self) -> Credential:
+        """
+        Best key to use right now. Raises QuotaExceededError if every key
+        has used up its quota.
+        """
+        with self._lock:
+            now = self._clock()
+            live = [c for c in self.credentials if c.exhausted_until <= now]
+            if not live:
+                raise QuotaExceededError("Every Amadeus key has used up its quota")
+
+            ready = [c for c in live if c.throttled_until <= now]
+            if not ready:
+                # All throttled: take the key that recovers first
+                return min(live, key=lambda c: c.throttled_until)
+
+            return max(ready, key=lambda c: (
+                round(c.rate_limiter.available()),
+                c.quota_left,
+                -c.failures,
+            ))
+
+    def has_ready(self, exclude: Optional[Credential] = None) -> bool:
+        """
+        True if some other key can take a request immediately.
+        """
+        now = self._clock()
+        return any(
+            c is not exclude and c.exhausted_until <= now and c.throttled_until <= now
+            for c in self.credentials
+        )
+
+    def mark_throttled(self, credential: Credential, retry_after: Optional[float] = None) -> None:
+        with self._lock:
+            credential.failures += 1
+            credential.throttled_until = self._clock() + (retry_after or DEFAULT_THROTTLE_SECONDS)
+        logger.warning(f"{credential} throttled — routing around it")
+
+    def mark_exhausted(self, credential: Credential) -> None:
+        with self._lock:
+            credential.exhausted_until = self._clock() + EXHAUSTED_BACKOFF
+            credential.quota_left = 0.0
+        logger.warning(f"{credential} is out of quota — skipping it")
+
+    def mark_success(self, credential: Credential) -> None:
+        credential.failures = 0
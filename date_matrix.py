@@ -0,0 +1,347 @@
+import heapq
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from api.amadeus_client import AmadeusClient, SearchQuery
+from core.processor import (
+    EXCLUDED_AIRLINES,
+    auto_column_widths,
+    extract_flights,
+    make_table,
+    render_ascii_block,
+)
+
+# Cells searched per round before the bounds are tightened again
+MATRIX_BATCH_SIZE = 8
+# Seeded cells per row and column before best-first search starts
+SEED_DEPTH = 2
+# Alternating-means passes when fitting the additive fare model; sparse
+# grids converge slowly, so stop early once prices move under a cent
+ADDITIVE_FIT_ROUNDS = 500
+ADDITIVE_FIT_TOLERANCE = 0.01
+# In-sample residuals understate how far an unseen fare can fall below
+# the fit (each seed row/column has only a couple of cells), so the worst
+# observed shortfall is scaled up by this before it lowers the slack
+RESIDUAL_INFLATION = 2.0
+# Approximate mode: multiplies the estimated floor of an unsearched cell.
+# < 1 searches more cells (safer against non-additive fares); 0 searches
+# the whole grid.
+DEFAULT_SLACK = 0.97
+
+Cell = Tuple[str, str]  # (departure_date, return_date)
+
+
+def cheapest_offer(raw: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    Cheapest round-trip offer in a response, excluding EXCLUDED_AIRLINES.
+    """
+    if not raw or "errors" in raw:
+        return None
+
+    carriers = raw.get("dictionaries", {}).get("carriers", {})
+    flights = [
+        f for f in extract_flights(raw, carriers)
+        if f["airline"].split(" — ")[0] not in EXCLUDED_AIRLINES
+    ]
+    return min(flights, key=lambda f: f["price"]) if flights else None
+
+
+class DateMatrixResult:
+    """
+    Outcome of a matrix search.
+    grid[(dep, ret)] is the cheapest price for every cell that has one;
+    `empty` holds cells searched without a usable offer and `pruned` the
+    cells never fetched (search budget spent, or skipped on an estimate
+    in approximate mode). Pruned cells may hold cheaper fares: best() is
+    only exact when `exact` is true.
+    """
+
+    def __init__(self, departure_dates: List[str], return_dates: List[str]):
+        self.departure_dates = departure_dates
+        self.return_dates = return_dates
+        self.grid: Dict[Cell, float] = {}
+        self.flights: Dict[Cell, Dict[str, Any]] = {}
+        self.empty: Set[Cell] = set()
+        self.pruned: Set[Cell] = set()
+        self.searched = 0
+
+    @property
+    def exact(self) -> bool:
+        return not self.pruned
+
+    def known(self, cell: Cell) -> bool:
+        return cell in self.grid or cell in self.empty
+
+    def best(self, k: int) -> List[Dict[str, Any]]:
+        cells = heapq.nsmallest(k, self.flights.items(), key=lambda item: item[1]["price"])
+        return [
+            {"departure_date": dep, "return_date": ret, **flight}
+            for (dep, ret), flight in cells
+        ]
+
+    def format_grid(self) -> str:
+        """
+        Departure dates down, return dates across. "·" marks a cell that
+        was not searched, "-" a cell with no offers, blank an impossible pairing.
+        """
+        headers = ["DEPART \\ RETURN"] + [r[5:] for r in self.return_dates]
+        rows = []
+        for dep in self.departure_dates:
+            row = [dep]
+            for ret in self.return_dates:
+                cell = (dep, ret)
+                if cell in self.grid:
+                    row.append(f"{self.grid[cell]:.0f}")
+                elif cell in self.pruned:
+                    row.append("·")
+                elif cell in self.empty:
+                    row.append("-")
+                else:
+                    row.append("")
+            rows.append(row)
+
+        widths = auto_column_widths(headers, rows)
+        aligns = ["left"] + ["right"] * len(self.return_dates)
+        return render_ascii_block(make_table(headers, rows, widths, aligns))
+
+    def format_best(self, k: int) -> str:
+        best = self.best(k)
+        if not best:
+            return "No round-trip offers found in this window."
+
+        note = "" if self.exact else (
+            f"\n≈ Approximate: {len(self.pruned)} cells were not searched and may be cheaper."
+        )
+
+        headers = ["#", "Depart", "Return", "Price", "Airline", "Out", "Back"]
+        rows = [
+            [
+                i,
+                b["departure_date"],
+                b["return_date"],
+                f"{b['price']:.2f}",
+                b["airline"],
+                b["duration"],
+                b["legs"][-1]["duration"],
+            ]
+            for i, b in enumerate(best, start=1)
+        ]
+        widths = auto_column_widths(headers, rows)
+        aligns = ["right", "left", "left", "right", "left", "left", "left"]
+        return render_ascii_block(make_table(headers, rows, widths, aligns)) + note
+
+
+class DateMatrixSearch:
+    """
+    Search over a departure × return date grid.
+
+    By default every valid cell is searched (cached cells for free, the
+    rest in batches through client.search_many, so cache, single-flight
+    and rate limiting apply) and the result is exact. No admissible lower
+    bound exists for an unsearched fare, so any pruning is a guess.
+
+    approximate=True trades that for fewer calls. Round-trip fares are
+    close to additive (outbound part + return part), so the searched
+    cells are fitted to price(d, r) ≈ out[d] + back[r] and every
+    unsearched cell gets an estimated floor of
+
+        floor(d, r) = slack * (out[d] + back[r])
+
+    where slack drops further whenever seen fares fall below the fit (see
+    RESIDUAL_INFLATION). A connected staircase of seeds covers every row
+    and column twice; cells are then searched cheapest-estimate first and
+    the search stops once no estimate beats the k-th best price so far.
+    Noisy grids or one-off discounts can be missed: the result's `pruned`
+    cells are reported and format_best() marks the answer as approximate.
+    """
+
+    def __init__(
+        self,
+        client: AmadeusClient,
+        origin: str,
+        destination: str,
+        departure_dates: List[str],
+        return_dates: List[str],
+        min_stay: int = 1,
+        top_k: int = 5,
+        slack: float = DEFAULT_SLACK,
+        batch_size: int = MATRIX_BATCH_SIZE,
+        seed_depth: int = SEED_DEPTH,
+        max_searches: Optional[int] = None,
+        cell_offer: Callable[[Dict[str, Any]], Optional[Dict[str, Any]]] = cheapest_offer,
+        approximate: bool = False,
+    ):
+        self.client = client
+        self.origin = origin
+        self.destination = destination
+        self.departure_dates = list(departure_dates)
+        self.return_dates = list(return_dates)
+        self.min_stay = min_stay
+        self.top_k = top_k
+        self.slack = slack
+        self.batch_size = batch_size
+        self.seed_depth = seed_depth
+        self.max_searches = max_searches
+        self.cell_offer = cell_offer
+        self.approximate = approximate
+
+    # ---------------------------------------------------------
+    # GRID
+    # ---------------------------------------------------------
+    def cells(self) -> List[Cell]:
+        """
+        Every (departure, return) pair that leaves at least min_stay nights.
+        """
+        out = []
+        for dep in self.departure_dates:
+            dep_day = datetime.strptime(dep, "%Y-%m-%d")
+            for ret in self.return_dates:
+                if (datetime.strptime(ret, "%Y-%m-%d") - dep_day).days >= self.min_stay:
+                    out.append((dep, ret))
+        return out
+
+    def _seed_cells(self, cells: List[Cell], priced: Dict[Cell, float]) -> List[Cell]:
+        """
+        A small, connected set of cells touching every row and column
+        seed_depth times: a staircase where row i takes columns i, i+1, ...
+        Neighbouring rows share a column, which ties the additive fit
+        together across the whole grid. Cells already priced are skipped.
+        """
+        if not self.return_dates:
+            return []
+
+        valid = set(cells)
+        seeds = []
+        row_count: Dict[str, int] = {}
+        col_count: Dict[str, int] = {}
+
+        def take(cell):
+            seeds.append(cell)
+            row_count[cell[0]] = row_count.get(cell[0], 0) + 1
+            col_count[cell[1]] = col_count.get(cell[1], 0) + 1
+
+        for cell in priced:
+            row_count[cell[0]] = row_count.get(cell[0], 0) + 1
+            col_count[cell[1]] = col_count.get(cell[1], 0) + 1
+
+        n_returns = len(self.return_dates)
+        for i, dep in enumerate(self.departure_dates):
+            for step in range(self.seed_depth):
+                cell = (dep, self.return_dates[(i + step) % n_returns])
+                if cell in valid and cell not in priced and cell not in seeds:
+                    take(cell)
+
+        # Rows/columns the staircase missed (min_stay gaps, wide grids)
+        for cell in cells:
+            if cell in priced or cell in seeds:
+                continue
+            if row_count.get(cell[0], 0) < self.seed_depth or col_count.get(cell[1], 0) < self.seed_depth:
+                take(cell)
+
+        return seeds
+
+    # ---------------------------------------------------------
+    # SEARCH
+    # ---------------------------------------------------------
+    def _fetch(self, cells: List[Cell], result: DateMatrixResult) -> None:
+        queries = [SearchQuery(self.origin, self.destination, dep, return_date=ret) for dep, ret in cells]
+        for query, raw in self.client.search_many(queries, max_workers=self.batch_size):
+            self._record((query.date, query.return_date), raw, result)
+            result.searched += 1
+
+    def _record(self, cell: Cell, raw: Optional[Dict[str, Any]], result: DateMatrixResult) -> None:
+        offer = self.cell_offer(raw) if raw else None
+        if offer is None:
+            result.empty.add(cell)
+            return
+        result.grid[cell] = offer["price"]
+        result.flights[cell] = offer
+
+    def _kth_best(self, result: DateMatrixResult) -> float:
+        prices = heapq.nsmallest(self.top_k, (f["price"] for f in result.flights.values()))
+        return prices[-1] if len(prices) >= self.top_k else float("inf")
+
+    @staticmethod
+    def _fit_additive(grid: Dict[Cell, float]) -> Tuple[Dict[str, float], Dict[str, float]]:
+        """
+        Least-squares fit of price(d, r) ≈ out[d] + back[r] over the seen
+        cells, by alternating row/column means.
+        """
+        rows: Dict[str, List[Tuple[str, float]]] = {}
+        cols: Dict[str, List[Tuple[str, float]]] = {}
+        for (dep, ret), price in grid.items():
+            rows.setdefault(dep, []).append((ret, price))
+            cols.setdefault(ret, []).append((dep, price))
+
+        out = {dep: sum(p for _, p in cells) / len(cells) for dep, cells in rows.items()}
+        back = {ret: 0.0 for ret in cols}
+        for _ in range(ADDITIVE_FIT_ROUNDS):
+            back = {ret: sum(p - out[dep] for dep, p in cells) / len(cells) for ret, cells in cols.items()}
+            fitted = {dep: sum(p - back[ret] for ret, p in cells) / len(cells) for dep, cells in rows.items()}
+            moved = max(abs(fitted[dep] - out[dep]) for dep in out)
+            out = fitted
+            if moved < ADDITIVE_FIT_TOLERANCE:
+                break
+        return out, back
+
+    def _floors(self, pending: List[Cell], result: DateMatrixResult) -> List[Tuple[float, Cell]]:
+        grid = result.grid
+        if not grid:
+            return [(0.0, cell) for cell in pending]
+
+        out, back = self._fit_additive(grid)
+
+        # Calibrate against the cells already seen: how far below the
+        # model has a real fare fallen? Additive fares sit on the fit;
+        # noisy grids push the slack down and more cells get searched.
+        slack = self.slack
+        for (dep, ret), price in grid.items():
+            estimate = out[dep] + back[ret]
+            if estimate > 0:
+                slack = min(slack, 1.0 - RESIDUAL_INFLATION * (1.0 - price / estimate))
+
+        floors = []
+        for dep, ret in pending:
+            if dep in out and ret in back:
+                floor = slack * max(0.0, out[dep] + back[ret])
+            else:
+                floor = 0.0  # nothing priced in this row/column yet
+            floors.append((floor, (dep, ret)))
+        floors.sort()
+        return floors
+
+    def run(self) -> DateMatrixResult:
+        result = DateMatrixResult(self.departure_dates, self.return_dates)
+        cells = self.cells()
+
+        # Cells already in the response cache cost nothing
+        for dep, ret in cells:
+            raw = self.client.cached_search(self.origin, self.destination, dep, return_date=ret)
+            if raw is not None:
+                self._record((dep, ret), raw, result)
+
+        budget = self.max_searches if self.max_searches is not None else len(cells)
+
+        if not self.approximate:
+            self._fetch([c for c in cells if not result.known(c)][:budget], result)
+            result.pruned = {c for c in cells if not result.known(c)}
+            return result
+
+        seeds = [c for c in self._seed_cells(cells, result.grid) if c not in result.empty]
+        self._fetch(seeds[:budget], result)
+
+        while result.searched < budget:
+            pending = [c for c in cells if not result.known(c)]
+            if not pending:
+                break
+
+            floors = self._floors(pending, result)
+            cutoff = self._kth_best(result)
+            batch = [cell for floor, cell in floors if floor < cutoff]
+            if not batch:
+                break
+
+            self._fetch(batch[:min(self.batch_size, budget - result.searched)], result)
+
+        result.pruned = {c for c in cells if not result.known(c)}
+        return result
@@ -0,0 +1,367 @@
+from array import array
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # optional: zero-copy column views
+    np = None
+
+TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%S"
+_EPOCH = datetime(1970, 1, 1)
+
+# Column name → array typecode
+COLUMNS = {
+    "price": "d",
+    "duration_minutes": "l",
+    "stops": "b",
+    "layover_hours": "d",
+    "departure_epoch": "q",
+    "arrival_epoch": "q",
+    "airline": "H",          # index into FlightTable.airlines
+    "layover_city": "H",     # index into FlightTable.cities
+    "duration_label": "H",   # index into FlightTable.duration_labels
+    "day": "H",              # index into FlightTable.days
+}
+
+
+class StringDictionary:
+    """
+    Append-only string ↔ small-int dictionary for encoded columns.
+    """
+
+    def __init__(self, values: Iterable[str] = ()):
+        self.values: List[str] = []
+        self._index: Dict[str, int] = {}
+        for value in values:
+            self.encode(value)
+
+    def encode(self, value: str) -> int:
+        code = self._index.get(value)
+        if code is None:
+            code = self._index[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def code(self, value: str) -> Optional[int]:
+        return self._index.get(value)
+
+    def __getitem__(self, code: int) -> str:
+        return self.values[code]
+
+    def __len__(self):
+        return len(self.values)
+
+
+def _from_epoch(seconds: int) -> str:
+    return (_EPOCH + timedelta(seconds=seconds)).strftime(TIMESTAMP_FORMAT)
+
+
+def _to_epoch(at: Any) -> int:
+    """
+    Seconds since 1970 for a TIMESTAMP_FORMAT wall-clock time. Other ISO
+    8601 forms (fractional seconds, UTC offsets) keep their wall-clock
+    time; missing or unparseable values are 0.
+    """
+    if not at:
+        return 0
+    try:
+        # fromisoformat also reads TIMESTAMP_FORMAT, far faster than strptime
+        return int((datetime.fromisoformat(at).replace(tzinfo=None) - _EPOCH).total_seconds())
+    except (TypeError, ValueError):
+        return 0
+
+
+def _lazy_epochs(name: str) -> property:
+    # Tables built by from_flights() parse their timestamps on first use:
+    # ranking never reads them, and parsing would dominate the build
+    def get(self):
+        if self._pending_times:
+            self._parse_times()
+        return self.__dict__[name]
+
+    def set(self, value):
+        self.__dict__[name] = value
+
+    return property(get, set)
+
+
+class FlightTable:
+    """
+    Columnar store for normalized flight offers (outbound leg fields).
+
+    Numbers live in typed `array` columns; airline, layover city, display
+    duration and date are dictionary-encoded, so a row costs ~40 bytes
+    instead of a dict of Python objects, and every later stage reads
+    ready-made numbers (no float()/duration parsing/label splitting).
+
+        table = FlightTable.from_offers(raw["data"], carriers, date="2026-03-20")
+        table = table.exclude_airlines({"CX", "AI"}).max_layover(6)
+        table.price[i], table.duration_minutes[i], table.airline_code(i)
+
+    row(i) / to_flights() rebuild the same dicts extract_flights returns
+    (without `legs`) for code that still wants them.
+    """
+
+    departure_epoch = _lazy_epochs("departure_epoch")
+    arrival_epoch = _lazy_epochs("arrival_epoch")
+
+    def __init__(self):
+        # from_flights(): departure/arrival strings as given, until parsed
+        self._times: Optional[Tuple[List[str], List[str]]] = None
+        self._pending_times = False
+
+        for name, typecode in COLUMNS.items():
+            setattr(self, name, array(typecode))
+
+        self.airlines = StringDictionary()           # full labels: "EY — ETIHAD AIRWAYS"
+        self.airline_codes: List[str] = []           # parallel to airlines: "EY"
+        self.cities = StringDictionary([""])         # "" = nonstop
+        self.duration_labels = StringDictionary()
+        self.days = StringDictionary()
+
+    def __len__(self):
+        return len(self.price)
+
+    def __bool__(self):
+        return len(self.price) > 0
+
+    # ---------------------------------------------------------
+    # BUILDING
+    # ---------------------------------------------------------
+    def _encode_airline(self, label: str, code: str = None) -> int:
+        idx = self.airlines.code(label)
+        if idx is None:
+            idx = self.airlines.encode(label)
+            self.airline_codes.append(code if code is not None else label.split(" — ")[0])
+        return idx
+
+    def _append(self, price: float, duration_minutes: int, duration_label: str, stops: int,
+                layover_hours: float, layover_city: str, departure_epoch: int, arrival_epoch: int,
+                airline: int, day: str = "") -> None:
+        self.departure_epoch.append(departure_epoch)
+        self.arrival_epoch.append(arrival_epoch)
+        self._append_untimed(price, duration_minutes, duration_label, stops,
+                             layover_hours, layover_city, airline, day)
+
+    def _append_untimed(self, price: float, duration_minutes: int, duration_label: str, stops: int,
+                        layover_hours: float, layover_city: str, airline: int, day: str = "") -> None:
+        self.price.append(price)
+        self.duration_minutes.append(duration_minutes)
+        self.duration_label.append(self.duration_labels.encode(duration_label))
+        self.stops.append(stops)
+        self.layover_hours.append(layover_hours)
+        self.layover_city.append(self.cities.encode(layover_city))
+        self.airline.append(airline)
+        self.day.append(self.days.encode(day))
+
+    def _parse_times(self) -> None:
+        self._pending_times = False
+        departures, arrivals = self._times
+        self.__dict__["departure_epoch"].extend(map(_to_epoch, departures))
+        self.__dict__["arrival_epoch"].extend(map(_to_epoch, arrivals))
+
+    def extend_offers(self, offers: Iterable[Dict[str, Any]], carrier_lookup: Dict[str, str],
+                      date: str = "") -> "FlightTable":
+        """
+        Appends raw Amadeus offers to the columns (outbound itinerary).
+        Offers go through the same parser as extract_flights, so offers
+        without segments or that fail to parse are skipped the same way.
+        """
+        from core.processor import iter_extract_flights, parse_duration_to_minutes
+
+        minutes_by_label: Dict[str, int] = {}
+        epochs: Dict[str, int] = {}
+
+        def epoch(at):
+            value = epochs.get(at)
+            if value is None:
+                value = epochs[at] = _to_epoch(at)
+            return value
+
+        for f in iter_extract_flights(offers, carrier_lookup):
+            minutes = minutes_by_label.get(f["duration"])
+            if minutes is None:
+                minutes = minutes_by_label[f["duration"]] = parse_duration_to_minutes(f["duration"])
+
+            self._append(
+                f["price"],
+                minutes,
+                f["duration"],
+                f["stops"],
+                f["layover_hours"],
+                f["layover_city"],
+                epoch(f["departure"]),
+                epoch(f["arrival"]),
+                self._encode_airline(f["airline"]),
+                date,
+            )
+
+        return self
+
+    @classmethod
+    def from_offers(cls, offers: Iterable[Dict[str, Any]], carrier_lookup: Dict[str, str],
+                    date: str = "") -> "FlightTable":
+        return cls().extend_offers(offers, carrier_lookup, date)
+
+    @classmethod
+    def from_flights(cls, flights: Iterable[Dict[str, Any]], date: str = "") -> "FlightTable":
+        """
+        Builds a table from extract_flights-style dicts. Departure and
+        arrival are kept as given and only parsed into the epoch columns
+        when something reads them.
+        """
+        from core.processor import parse_duration_to_minutes
+
+        table = cls()
+        departures: List[str] = []
+        arrivals: List[str] = []
+        minutes_by_label: Dict[str, int] = {}
+        for f in flights:
+            minutes = minutes_by_label.get(f["duration"])
+            if minutes is None:
+                minutes = minutes_by_label[f["duration"]] = parse_duration_to_minutes(f["duration"])
+
+            table._append_untimed(
+                float(f["price"]),
+                minutes,
+                f["duration"],
+                int(f.get("stops", 0)),
+                float(f["layover_hours"]),
+                f["layover_city"],
+                table._encode_airline(f["airline"]),
+                f.get("date", date),
+            )
+            departures.append(f.get("departure") or "")
+            arrivals.append(f.get("arrival") or "")
+
+        table._times = (departures, arrivals)
+        table._pending_times = True
+        return table
+
+    @classmethod
+    def concat(cls, tables: Iterable["FlightTable"]) -> "FlightTable":
+        """
+        One table holding every row of `tables`, in order (e.g. a whole
+        date window or several routes).
+        """
+        out = cls()
+        for table in tables:
+            out._extend_rows(table, range(len(table)))
+        return out
+
+    def _extend_rows(self, source: "FlightTable", indices: Iterable[int]) -> None:
+        airline_map = [self._encode_airline(label, code)
+                       for label, code in zip(source.airlines.values, source.airline_codes)]
+        city_map = [self.cities.encode(v) for v in source.cities.values]
+        label_map = [self.duration_labels.encode(v) for v in source.duration_labels.values]
+        day_map = [self.days.encode(v) for v in source.days.values]
+
+        for i in indices:
+            self.price.append(source.price[i])
+            self.duration_minutes.append(source.duration_minutes[i])
+            self.duration_label.append(label_map[source.duration_label[i]])
+            self.stops.append(source.stops[i])
+            self.layover_hours.append(source.layover_hours[i])
+            self.layover_city.append(city_map[source.layover_city[i]])
+            self.departure_epoch.append(source.departure_epoch[i])
+            self.arrival_epoch.append(source.arrival_epoch[i])
+            self.airline.append(airline_map[source.airline[i]])
+            self.day.append(day_map[source.day[i]])
+
+    # ---------------------------------------------------------
+    # FILTERS (return new tables)
+    # ---------------------------------------------------------
+    def take(self, indices: Iterable[int]) -> "FlightTable":
+        out = FlightTable()
+        out._extend_rows(self, indices)
+        return out
+
+    def exclude_airlines(self, codes: Iterable[str]) -> "FlightTable":
+        codes = set(codes)
+        excluded = {i for i, code in enumerate(self.airline_codes) if code in codes}
+        if not excluded:
+            return self
+        return self.take(i for i, a in enumerate(self.airline) if a not in excluded)
+
+    def max_layover(self, hours: float) -> "FlightTable":
+        return self.take(i for i, h in enumerate(self.layover_hours) if h <= hours)
+
+    # ---------------------------------------------------------
+    # ROW ACCESS
+    # ---------------------------------------------------------
+    def airline_label(self, i: int) -> str:
+        return self.airlines[self.airline[i]]
+
+    def airline_code(self, i: int) -> str:
+        return self.airline_codes[self.airline[i]]
+
+    def city(self, i: int) -> str:
+        return self.cities[self.layover_city[i]]
+
+    def duration_text(self, i: int) -> str:
+        return self.duration_labels[self.duration_label[i]]
+
+    def date(self, i: int) -> str:
+        return self.days[self.day[i]]
+
+    def departure(self, i: int) -> str:
+        if self._times is not None and i < len(self._times[0]):
+            return self._times[0][i]
+        return _from_epoch(self.departure_epoch[i])
+
+    def arrival(self, i: int) -> str:
+        if self._times is not None and i < len(self._times[1]):
+            return self._times[1][i]
+        return _from_epoch(self.arrival_epoch[i])
+
+    def row(self, i: int) -> Dict[str, Any]:
+        return {
+            "airline": self.airline_label(i),
+            "price": self.price[i],
+            "duration": self.duration_text(i),
+            "stops": self.stops[i],
+            "layover_city": self.city(i),
+            "layover_hours": self.layover_hours[i],
+            "departure": self.departure(i),
+            "arrival": self.arrival(i),
+        }
+
+    def to_flights(self) -> List[Dict[str, Any]]:
+        return [self.row(i) for i in range(len(self))]
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return (self.row(i) for i in range(len(self)))
+
+    # ---------------------------------------------------------
+    # COLUMN HELPERS
+    # ---------------------------------------------------------
+    def min_price(self) -> Optional[float]:
+        return min(self.price) if self.price else None
+
+    def argmin(self, column: str) -> Optional[int]:
+        """
+        Row of the smallest value in `column`; the first one on ties.
+        """
+        if not len(self):
+            return None
+        if np is not None:
+            return int(np.argmin(self.numpy(column)))
+        values = getattr(self, column)
+        return min(range(len(values)), key=values.__getitem__)
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Bytes held by the numeric columns (dictionaries excluded).
+        """
+        return sum(getattr(self, name).itemsize * len(self) for name in COLUMNS)
+
+    def numpy(self, column: str):
+        """
+        Zero-copy NumPy view of a column. Requires numpy.
+        """
+        if np is None:
+            raise ImportError("numpy is not installed")
+        values = getattr(self, column)
+        return np.frombuffer(values, dtype=values.typecode) if len(values) else np.empty(0, values.typecode)
@@ -0,0 +1,87 @@
+import json
+from typing import Any, Dict, Union
+
+try:
+    import orjson
+except ImportError:  # optional speed-up
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # optional speed-up
+    msgspec = None
+
+
+class JsonCodec:
+    """
+    Pluggable JSON encode/decode used for Amadeus payloads and the caches.
+    loads() accepts bytes or str; dumps() returns bytes.
+    """
+
+    name = "base"
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        raise NotImplementedError
+
+    def dumps(self, obj: Any) -> bytes:
+        raise NotImplementedError
+
+
+class StdlibJsonCodec(JsonCodec):
+    name = "json"
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return json.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+class OrjsonCodec(JsonCodec):
+    name = "orjson"
+
+    def __init__(self):
+        if orjson is None:
+            raise ImportError("orjson is not installed")
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return orjson.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        return orjson.dumps(obj)
+
+
+class MsgspecJsonCodec(JsonCodec):
+    name = "msgspec"
+
+    def __init__(self):
+        if msgspec is None:
+            raise ImportError("msgspec is not installed")
+        self._decoder = msgspec.json.Decoder()
+        self._encoder = msgspec.json.Encoder()
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return self._decoder.decode(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._encoder.encode(obj)
+
+
+def available_codecs() -> Dict[str, JsonCodec]:
+    """
+    Every codec whose backing library is importable, fastest first.
+    """
+    codecs: Dict[str, JsonCodec] = {}
+    if orjson is not None:
+        codecs["orjson"] = OrjsonCodec()
+    if msgspec is not None:
+        codecs["msgspec"] = MsgspecJsonCodec()
+    codecs["json"] = StdlibJsonCodec()
+    return codecs
+
+
+def get_default_codec() -> JsonCodec:
+    """
+    Fastest installed codec; falls back to the stdlib json module.
+    """
+    return next(iter(available_codecs().values()))
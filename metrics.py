@@ -0,0 +1,206 @@
+import bisect
+import threading
+import time
+from typing import Dict, Optional, Sequence, Tuple
+
+# Histogram upper bounds. Latencies in seconds (1 ms .. 60 s)
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+                   1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+# Payload sizes in bytes (1 KB .. 16 MB)
+SIZE_BUCKETS = tuple(1024 * 4 ** i for i in range(8))
+# Small counts such as attempts per search
+COUNT_BUCKETS = (1, 2, 3, 4, 5, 6, 8, 10)
+
+METRIC_BUCKETS = {
+    "amadeus.payload_bytes": SIZE_BUCKETS,
+    "amadeus.wire_bytes": SIZE_BUCKETS,
+    "amadeus.attempts": COUNT_BUCKETS,
+}
+
+# httpcore trace steps → latency phases (DNS is part of connect_tcp)
+TRACE_PHASES = {
+    "connect_tcp": "connect",
+    "start_tls": "tls",
+    "receive_response_headers": "server",
+    "receive_response_body": "download",
+}
+
+Tags = Optional[Dict[str, str]]
+
+
+class MetricsSink:
+    """
+    Destination for client instrumentation.
+
+    observe() feeds a histogram (latency, sizes, attempts); increment()
+    bumps a counter (status codes, cache hits). Subclass to forward to
+    statsd / Prometheus / logs; the default does nothing.
+    """
+
+    def observe(self, name: str, value: float, tags: Tags = None) -> None:
+        pass
+
+    def increment(self, name: str, value: int = 1, tags: Tags = None) -> None:
+        pass
+
+
+class NullSink(MetricsSink):
+    """
+    Discards everything. Used when no sink is configured.
+    """
+
+
+class Histogram:
+    """
+    Fixed-bucket histogram: constant memory, cheap to update from any thread
+    (callers hold the sink's lock). Percentiles interpolate within a bucket.
+    """
+
+    def __init__(self, buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)   # last slot is overflow
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    @property
+    def mean(self) -> Optional[float]:
+        return self.total / self.count if self.count else None
+
+    def percentile(self, q: float) -> Optional[float]:
+        """
+        Approximate q-th percentile (0-100).
+        """
+        if not self.count:
+            return None
+
+        rank = q / 100.0 * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            if n and seen + n >= rank:
+                lower = self.buckets[i - 1] if i > 0 else self.min
+                upper = self.buckets[i] if i < len(self.buckets) else self.max
+                lower, upper = max(lower, self.min), min(upper, self.max)
+                return lower + (upper - lower) * (rank - seen) / n
+            seen += n
+        return self.max
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            "min": self.min,
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+            "max": self.max,
+        }
+
+
+class InMemoryMetrics(MetricsSink):
+    """
+    Keeps histograms and counters in process, keyed by name + tags.
+    Good for benchmarks and tuning runs:
+
+        metrics = InMemoryMetrics()
+        client = AmadeusClient(metrics=metrics)
+        ...
+        print(metrics.format_report())
+    """
+
+    def __init__(self, buckets: Dict[str, Sequence[float]] = None):
+        self.buckets = dict(METRIC_BUCKETS, **(buckets or {}))
+        self.histograms: Dict[Tuple, Histogram] = {}
+        self.counters: Dict[Tuple, int] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(name: str, tags: Tags) -> Tuple:
+        return (name,) + tuple(sorted((tags or {}).items()))
+
+    def observe(self, name: str, value: float, tags: Tags = None) -> None:
+        key = self._key(name, tags)
+        with self._lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = Histogram(self.buckets.get(name, LATENCY_BUCKETS))
+            histogram.observe(value)
+
+    def increment(self, name: str, value: int = 1, tags: Tags = None) -> None:
+        key = self._key(name, tags)
+        with self._lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    def histogram(self, name: str, **tags) -> Optional[Histogram]:
+        return self.histograms.get(self._key(name, tags))
+
+    def counter(self, name: str, **tags) -> int:
+        return self.counters.get(self._key(name, tags), 0)
+
+    def reset(self) -> None:
+        with self._lock:
+            self.histograms.clear()
+            self.counters.clear()
+
+    @staticmethod
+    def _label(key: Tuple) -> str:
+        name, tags = key[0], key[1:]
+        if not tags:
+            return name
+        return name + "{" + ",".join(f"{k}={v}" for k, v in tags) + "}"
+
+    def snapshot(self) -> Dict[str, Dict]:
+        with self._lock:
+            return {
+                "histograms": {self._label(k): h.summary() for k, h in sorted(self.histograms.items())},
+                "counters": {self._label(k): n for k, n in sorted(self.counters.items())},
+            }
+
+    def format_report(self) -> str:
+        snap = self.snapshot()
+        lines = []
+        for label, s in snap["histograms"].items():
+            lines.append(
+                f"{label}: n={s['count']} mean={s['mean']:.4g} p50={s['p50']:.4g} "
+                f"p90={s['p90']:.4g} p99={s['p99']:.4g} max={s['max']:.4g}"
+            )
+        for label, n in snap["counters"].items():
+            lines.append(f"{label}: {n}")
+        return "\n".join(lines)
+
+
+class TracePhases:
+    """
+    httpx `trace` extension callback. Turns httpcore connection events
+    into per-phase durations (connect, tls, server, download):
+
+        trace = TracePhases()
+        await session.get(url, extensions={"trace": trace})
+        trace.durations  # {"connect": 0.031, "tls": 0.052, ...}
+
+    Reused keep-alive connections simply produce no connect/tls phase.
+    """
+
+    def __init__(self):
+        self.durations: Dict[str, float] = {}
+        self._started: Dict[str, float] = {}
+
+    async def __call__(self, event_name: str, info) -> None:
+        prefix, _, event = event_name.rpartition(".")
+        phase = TRACE_PHASES.get(prefix.rpartition(".")[2])
+        if phase is None:
+            return
+
+        now = time.perf_counter()
+        if event == "started":
+            self._started[phase] = now
+        elif phase in self._started:
+            self.durations[phase] = self.durations.get(phase, 0.0) + now - self._started.pop(phase)
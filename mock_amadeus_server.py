@@ -0,0 +1,446 @@
+"""
+Local stand-in for the Amadeus Self-Service API, for offline load testing.
+
+Implements:
+- POST /v1/security/oauth2/token
+- GET  /v2/shopping/flight-offers (one-way, or round trip with returnDate)
+- POST /v2/shopping/flight-offers (multi-city JSON body)
+- GET  /v1/shopping/flight-dates (cheapest-date calendar)
+
+Offers are synthetic but shaped like the real payload (data + dictionaries)
+and deterministic per search, so repeated runs see the same prices.
+Latency, 5xx error rate, 429 throttling and token expiry are configurable.
+
+Point the client at it with Config.AMADEUS_BASE_URL (or AmadeusClient(base_url=...)):
+
+    python mock_amadeus_server.py --port 8089 --latency 0.4 --error-rate 0.05 --tps 10
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+TOKEN_PATH = "/v1/security/oauth2/token"
+SEARCH_PATH = "/v2/shopping/flight-offers"
+CALENDAR_PATH = "/v1/shopping/flight-dates"
+
+# carrier code → (name, hub)
+CARRIERS = {
+    "EY": ("ETIHAD AIRWAYS", "AUH"),
+    "EK": ("EMIRATES", "DXB"),
+    "QR": ("QATAR AIRWAYS", "DOH"),
+    "LH": ("LUFTHANSA", "FRA"),
+    "BA": ("BRITISH AIRWAYS", "LHR"),
+    "TK": ("TURKISH AIRLINES", "IST"),
+    "AC": ("AIR CANADA", "YUL"),
+    "AI": ("AIR INDIA", "DEL"),
+    "CX": ("CATHAY PACIFIC", "HKG"),
+}
+
+ISO_FMT = "%Y-%m-%dT%H:%M:%S"
+
+
+class MockOptions:
+    """
+    Behaviour knobs for the stand-in server.
+    """
+
+    def __init__(
+        self,
+        latency: float = 0.2,
+        latency_jitter: float = 0.1,
+        error_rate: float = 0.0,
+        throttle_rate: float = 0.0,
+        tps: float = 0.0,
+        token_ttl: int = 1799,
+        seed: int = 0,
+    ):
+        self.latency = latency
+        self.latency_jitter = latency_jitter
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.tps = tps                  # 0 = unlimited
+        self.token_ttl = token_ttl
+        self.seed = seed
+
+
+def _iso_duration(minutes: int) -> str:
+    return f"PT{minutes // 60}H{minutes % 60}M"
+
+
+def generate_offers(origin, destination, date, adults=1, children=0, max_results=50, seed=0,
+                    return_date=None):
+    """
+    Builds a deterministic flight-offers payload for one search
+    (a round trip when return_date is given).
+    """
+    legs = [(origin, destination, date)]
+    if return_date:
+        legs.append((destination, origin, return_date))
+    return generate_itinerary_offers(legs, adults, children, max_results, seed)
+
+
+def _mock_itinerary(rng, code, hub, origin, destination, timings):
+    first_leg, layover, second_leg, dep1 = timings
+    arr1 = dep1 + timedelta(minutes=first_leg)
+    dep2 = arr1 + timedelta(minutes=layover)
+    arr2 = dep2 + timedelta(minutes=second_leg)
+
+    return {
+        "duration": _iso_duration(first_leg + layover + second_leg),
+        "segments": [
+            {
+                "departure": {"iataCode": origin, "at": dep1.strftime(ISO_FMT)},
+                "arrival": {"iataCode": hub, "at": arr1.strftime(ISO_FMT)},
+                "carrierCode": code,
+                "number": str(rng.randint(10, 999)),
+                "duration": _iso_duration(first_leg),
+                "numberOfStops": 0,
+            },
+            {
+                "departure": {"iataCode": hub, "at": dep2.strftime(ISO_FMT)},
+                "arrival": {"iataCode": destination, "at": arr2.strftime(ISO_FMT)},
+                "carrierCode": code,
+                "number": str(rng.randint(10, 999)),
+                "duration": _iso_duration(second_leg),
+                "numberOfStops": 0,
+            },
+        ],
+    }
+
+
+def generate_itinerary_offers(legs, adults=1, children=0, max_results=50, seed=0):
+    """
+    Offers with one itinerary per (origin, destination, date) leg, each
+    connecting through the carrier's hub. Later legs add to the fare at a
+    discount, as bundled round-trip / multi-city fares do.
+    """
+    key = "|".join([str(seed)] + [part for leg in legs for part in leg])
+    digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+    rng = random.Random(int(digest[:16], 16))
+
+    travellers = max(1, int(adults)) + int(children)
+    days = [datetime.strptime(date, "%Y-%m-%d") for _, _, date in legs]
+    # Weekends run hotter than mid-week
+    day_factor = 1.15 if days[0].weekday() >= 4 else 1.0
+    leg_factor = 1.0 + 0.7 * (len(legs) - 1)
+
+    offers = []
+    used_carriers = {}
+    count = min(int(max_results), rng.randint(max(1, int(max_results) // 2), int(max_results)))
+
+    for idx in range(1, count + 1):
+        code = rng.choice(list(CARRIERS))
+        name, hub = CARRIERS[code]
+        used_carriers[code] = name
+
+        timings = [
+            (rng.randint(6 * 60, 14 * 60), rng.randint(70, 10 * 60), rng.randint(3 * 60, 9 * 60),
+             day + timedelta(minutes=rng.randint(0, 23 * 60)))
+            for day in days
+        ]
+
+        per_person = rng.uniform(650, 2400) * day_factor * leg_factor
+        total = round(per_person * travellers, 2)
+
+        offers.append({
+            "type": "flight-offer",
+            "id": str(idx),
+            "source": "GDS",
+            "numberOfBookableSeats": rng.randint(1, 9),
+            "itineraries": [
+                _mock_itinerary(rng, code, hub, origin, destination, leg_timings)
+                for (origin, destination, _), leg_timings in zip(legs, timings)
+            ],
+            "price": {
+                "currency": "CAD",
+                "total": f"{total:.2f}",
+                "base": f"{total * 0.82:.2f}",
+                "grandTotal": f"{total:.2f}",
+            },
+            "validatingAirlineCodes": [code],
+        })
+
+    return {
+        "meta": {"count": len(offers)},
+        "data": offers,
+        "dictionaries": {
+            "carriers": used_carriers,
+            "currencies": {"CAD": "CANADIAN DOLLAR"},
+        },
+    }
+
+
+def generate_calendar(origin, destination, start_date, end_date, seed=0):
+    """
+    Cheapest one-adult price per departure date, consistent with
+    generate_offers() so the calendar ranks days the same way.
+    """
+    entries = []
+    day = datetime.strptime(start_date, "%Y-%m-%d")
+    end = datetime.strptime(end_date, "%Y-%m-%d")
+
+    while day <= end:
+        date = day.strftime("%Y-%m-%d")
+        offers = generate_offers(origin, destination, date, adults=1, children=0, seed=seed)["data"]
+        cheapest = min(float(o["price"]["total"]) for o in offers)
+        entries.append({
+            "type": "flight-date",
+            "origin": origin,
+            "destination": destination,
+            "departureDate": date,
+            "price": {"total": f"{cheapest:.2f}"},
+        })
+        day += timedelta(days=1)
+
+    return {"data": entries, "dictionaries": {"currencies": {"CAD": "CANADIAN DOLLAR"}}}
+
+
+class MockAmadeusState:
+    """
+    Shared server state: issued tokens and the per-second request window.
+    """
+
+    def __init__(self, options: MockOptions):
+        self.options = options
+        self.tokens = {}
+        self.window_start = 0
+        self.window_count = 0
+        self.requests_served = 0
+        self.lock = threading.Lock()
+        self.rng = random.Random(options.seed)
+
+    def issue_token(self) -> str:
+        token = uuid.uuid4().hex
+        with self.lock:
+            self.tokens[token] = time.time() + self.options.token_ttl
+        return token
+
+    def token_valid(self, token: str) -> bool:
+        with self.lock:
+            expires_at = self.tokens.get(token)
+        return expires_at is not None and expires_at > time.time()
+
+    def over_tps(self) -> bool:
+        if not self.options.tps:
+            return False
+        now = int(time.time())
+        with self.lock:
+            if now != self.window_start:
+                self.window_start = now
+                self.window_count = 0
+            self.window_count += 1
+            return self.window_count > self.options.tps
+
+    def roll(self, rate: float) -> bool:
+        with self.lock:
+            return self.rng.random() < rate
+
+
+class MockAmadeusHandler(BaseHTTPRequestHandler):
+    server_version = "MockAmadeus/1.0"
+    protocol_version = "HTTP/1.1"
+
+    @property
+    def state(self) -> MockAmadeusState:
+        return self.server.state
+
+    def log_message(self, fmt, *args):
+        logger.debug(fmt % args)
+
+    def _send_json(self, status: int, payload, headers=None):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/vnd.amadeus+json")
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_error(self, status: int, title: str, headers=None):
+        self._send_json(status, {"errors": [{"status": status, "title": title}]}, headers)
+
+    def _simulate_latency(self):
+        options = self.state.options
+        delay = options.latency + self.state.rng.uniform(-options.latency_jitter, options.latency_jitter)
+        if delay > 0:
+            time.sleep(delay)
+
+    def do_POST(self):
+        path = urlparse(self.path).path
+        length = int(self.headers.get("Content-Length", 0))
+        body = self.rfile.read(length).decode("utf-8")
+
+        if path == SEARCH_PATH:
+            self._serve(lambda: self._multi_city(json.loads(body)))
+            return
+
+        if path != TOKEN_PATH:
+            self._send_error(404, "NOT FOUND")
+            return
+
+        form = parse_qs(body)
+
+        if form.get("grant_type") != ["client_credentials"] or not form.get("client_id"):
+            self._send_error(401, "Invalid client")
+            return
+
+        self._send_json(200, {
+            "type": "amadeusOAuth2Token",
+            "token_type": "Bearer",
+            "access_token": self.state.issue_token(),
+            "expires_in": self.state.options.token_ttl,
+            "state": "approved",
+        })
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        if url.path not in (SEARCH_PATH, CALENDAR_PATH):
+            self._send_error(404, "NOT FOUND")
+            return
+
+        query = {k: v[0] for k, v in parse_qs(url.query).items()}
+        if url.path == CALENDAR_PATH:
+            self._serve(lambda: self._calendar(query))
+        else:
+            self._serve(lambda: self._search(query))
+
+    def _serve(self, build_payload):
+        """
+        Auth, throttling, latency and error injection shared by every
+        search endpoint, then responds with build_payload().
+        """
+        auth = self.headers.get("Authorization", "")
+        if not auth.startswith("Bearer ") or not self.state.token_valid(auth[len("Bearer "):]):
+            self._send_error(401, "Access token expired")
+            return
+
+        if self.state.over_tps() or self.state.roll(self.state.options.throttle_rate):
+            self._send_error(429, "Too many requests", {"Retry-After": "1"})
+            return
+
+        self._simulate_latency()
+
+        if self.state.roll(self.state.options.error_rate):
+            self._send_error(500, "INTERNAL ERROR")
+            return
+
+        try:
+            payload = build_payload()
+        except (KeyError, ValueError, TypeError) as e:
+            self._send_error(400, f"INVALID FORMAT: {e}")
+            return
+
+        with self.state.lock:
+            self.state.requests_served += 1
+        self._send_json(200, payload)
+
+    def _search(self, query):
+        return generate_offers(
+            query["originLocationCode"],
+            query["destinationLocationCode"],
+            query["departureDate"],
+            adults=query.get("adults", 1),
+            children=query.get("children", 0),
+            max_results=query.get("max", 50),
+            seed=self.state.options.seed,
+            return_date=query.get("returnDate"),
+        )
+
+    def _multi_city(self, body):
+        legs = [
+            (od["originLocationCode"], od["destinationLocationCode"], od["departureDateTimeRange"]["date"])
+            for od in body["originDestinations"]
+        ]
+        types = [t.get("travelerType") for t in body.get("travelers", [])]
+        return generate_itinerary_offers(
+            legs,
+            adults=types.count("ADULT") or 1,
+            children=types.count("CHILD"),
+            max_results=body.get("searchCriteria", {}).get("maxFlightOffers", 50),
+            seed=self.state.options.seed,
+        )
+
+    def _calendar(self, query):
+        start, end = _calendar_window(query["departureDate"])
+        return generate_calendar(
+            query["origin"],
+            query["destination"],
+            start,
+            end,
+            seed=self.state.options.seed,
+        )
+
+
+def _calendar_window(value: str):
+    start, _, end = value.partition(",")
+    return start, end or start
+
+
+def start_mock_server(host: str = "127.0.0.1", port: int = 0, options: MockOptions = None):
+    """
+    Starts the server on a daemon thread. Returns (server, base_url);
+    call server.shutdown() when done. port=0 picks a free port.
+    """
+    server = ThreadingHTTPServer((host, port), MockAmadeusHandler)
+    server.daemon_threads = True
+    server.state = MockAmadeusState(options or MockOptions())
+
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    base_url = f"http://{server.server_address[0]}:{server.server_address[1]}"
+    logger.info(f"Mock Amadeus server listening on {base_url}")
+    return server, base_url
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local Amadeus stand-in for load testing")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument("--latency", type=float, default=0.2, help="mean response latency (s)")
+    parser.add_argument("--latency-jitter", type=float, default=0.1)
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of 500 responses")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="fraction of random 429s")
+    parser.add_argument("--tps", type=float, default=0.0, help="429 above this many searches/s (0 = off)")
+    parser.add_argument("--token-ttl", type=int, default=1799, help="token lifetime (s)")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    options = MockOptions(
+        latency=args.latency,
+        latency_jitter=args.latency_jitter,
+        error_rate=args.error_rate,
+        throttle_rate=args.throttle_rate,
+        tps=args.tps,
+        token_ttl=args.token_ttl,
+        seed=args.seed,
+    )
+
+    server = ThreadingHTTPServer((args.host, args.port), MockAmadeusHandler)
+    server.daemon_threads = True
+    server.state = MockAmadeusState(options)
+    logger.info(f"Mock Amadeus server listening on http://{args.host}:{args.port}")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
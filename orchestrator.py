@@ -1,15 +1,21 @@
+import threading
 from datetime import datetime, timedelta
 from langchain_openai import ChatOpenAI
 from core.processor import build_full_report
 
 from utils.config import Config
-from api.amadeus_client import AmadeusClient
+from api.amadeus_client import AmadeusClient, SearchQuery
+from api.response_cache import ResponseCache
+from core.date_matrix import DateMatrixSearch
+from core.flight_table import FlightTable
+from core.scoring import ScoringEngine
 from core.processor import (
-    extract_flights,
+    BestDayAggregator,
     compute_best_day,
     build_best_day_section,
     build_top3_overall_section,
     build_daily_sections,
+    record_price_observation,
 )
 
 
@@ -69,55 +75,206 @@ def llm_extract_dates(user_request: str):
         return str(tomorrow), str(tomorrow + timedelta(days=4))
 
 
+# ---------------------------------------------------------
+# CONCURRENT FETCH STAGE
+# ---------------------------------------------------------
+
+# None = one worker per date, capped at the client's connection pool
+# (POOL_SIZE), so a whole window goes out in a single wave
+MAX_FETCH_WORKERS = None
+
+# Shared across pipeline runs in this process; the disk tier spans processes.
+# Built on first use, so importing this module never touches the disk.
+_response_cache = None
+_response_cache_lock = threading.Lock()
+
+
+def get_response_cache() -> ResponseCache:
+    """
+    The process-wide ResponseCache, created (with its SQLite file) on
+    first call.
+    """
+    global _response_cache
+    with _response_cache_lock:
+        if _response_cache is None:
+            _response_cache = ResponseCache()
+        return _response_cache
+
+
+def date_range(start_date: datetime, end_date: datetime):
+    """
+    Returns every date between start and end (inclusive) as YYYY-MM-DD strings.
+    """
+    dates = []
+    current = start_date
+    while current <= end_date:
+        dates.append(current.strftime("%Y-%m-%d"))
+        current += timedelta(days=1)
+    return dates
+
+
+def fetch_days(client: AmadeusClient, origin: str, destination: str, dates, max_workers: int = MAX_FETCH_WORKERS):
+    """
+    Searches every date in parallel via client.search_many.
+    Returns [(date_str, raw), ...] in the same order as `dates`,
+    so wall-clock time is close to the slowest single request.
+    """
+    queries = [SearchQuery(origin, destination, date_str) for date_str in dates]
+    results = {
+        query.date: raw
+        for query, raw in client.search_many(queries, max_workers=max_workers)
+    }
+    return [(date_str, results.get(date_str)) for date_str in dates]
+
+
+def select_candidate_dates(client: AmadeusClient, origin: str, destination: str, dates, top_n: int):
+    """
+    Cheapest-date pre-pass: one calendar call ranks the whole window, and
+    only these dates get a full offer search:
+    - the top_n cheapest days on the calendar
+    - days whose cached search has expired (still in the stale window),
+      so results already being tracked are refreshed
+    Every other day is dropped, including days the calendar has no fare
+    for. Falls back to every date if the calendar is unavailable.
+    """
+    if not dates or top_n >= len(dates):
+        return list(dates)
+
+    calendar = client.search_cheapest_dates(origin, destination, dates[0], dates[-1])
+    if not calendar:
+        return list(dates)
+
+    ranked = sorted((d for d in dates if d in calendar), key=lambda d: calendar[d])
+    selected = set(ranked[:top_n])
+
+    for date_str in dates:
+        if date_str in selected:
+            continue
+        expired = (
+            client.cached_search(origin, destination, date_str, allow_stale=True) is not None
+            and client.cached_search(origin, destination, date_str) is None
+        )
+        if expired:
+            selected.add(date_str)
+
+    return [d for d in dates if d in selected]
+
+
+def fetch_days_scheduled(client: AmadeusClient, origin: str, destination: str, dates, scheduler):
+    """
+    Fetches only the dates the PollScheduler says are due; the rest are
+    served from the response cache (stale entries allowed). A date that is
+    not due but has nothing cached is fetched anyway.
+    Returns ([(date_str, raw), ...] in date order, set of freshly fetched dates).
+    """
+    due = set(scheduler.due_dates(dates))
+
+    cached = {}
+    for date_str in dates:
+        if date_str not in due:
+            cached[date_str] = client.cached_search(origin, destination, date_str, allow_stale=True)
+            if cached[date_str] is None:
+                due.add(date_str)
+
+    fetched = dict(fetch_days(client, origin, destination, [d for d in dates if d in due]))
+    scheduler.mark_polled([d for d, raw in fetched.items() if raw])
+
+    results = [(d, fetched.get(d) if d in due else cached[d]) for d in dates]
+    return results, {d for d, raw in fetched.items() if raw}
+
+
+def prepare_day(date_str: str, raw) -> FlightTable:
+    """
+    Offers for one date with the pipeline's filters applied
+    (excluded airlines, layovers over 6h). Empty for failed searches.
+    """
+    if not raw or "errors" in raw:
+        return FlightTable()
+
+    carriers = raw.get("dictionaries", {}).get("carriers", {})
+    flights = FlightTable.from_offers(raw.get("data", []), carriers, date=date_str)
+
+    # Exclude unwanted airlines globally
+    excluded = {"CX", "AI"}
+    flights = flights.exclude_airlines(excluded)
+
+    # Same filter as classic mode
+    return flights.max_layover(6)
+
+
+def stream_best_day(client: AmadeusClient, origin: str, destination: str, dates,
+                    on_update=None, aggregator: BestDayAggregator = None,
+                    max_workers: int = MAX_FETCH_WORKERS) -> BestDayAggregator:
+    """
+    Searches every date in parallel and folds each one into a
+    BestDayAggregator as soon as it completes. on_update(date_str,
+    aggregator) runs after every day, for partial reports or early
+    alerts. Pass an existing aggregator to refresh some of its dates;
+    a refresh that fails (no response or an "errors" payload) keeps the
+    day's last good data.
+    """
+    aggregator = aggregator if aggregator is not None else BestDayAggregator(scoring=ScoringEngine.load())
+    queries = [SearchQuery(origin, destination, date_str) for date_str in dates]
+
+    for query, raw in client.search_many(queries, max_workers=max_workers):
+        if (raw is None or "errors" in raw) and query.date in aggregator:
+            continue  # keep the last good data for a failed refresh
+        aggregator.add_day(query.date, prepare_day(query.date, raw))
+        if on_update is not None:
+            on_update(query.date, aggregator)
+
+    return aggregator
+
+
 # ---------------------------------------------------------
 # MAIN PIPELINE (NO AGENTS)
 # ---------------------------------------------------------
 
-def run_pipeline_llm_routed(user_request: str):
+def run_pipeline_llm_routed(user_request: str, cassette=None, prepass_top_n=None, scheduler=None,
+                            metrics=None):
     """
     AI pipeline with fixed date range (March 20–24, 2026),
     same filters as classic mode.
+    Pass a Cassette to record or replay the Amadeus responses.
+    Set prepass_top_n to fully search only the calendar's cheapest days.
+    Pass a PollScheduler to refetch only dates whose refresh interval is due.
+    Pass a MetricsSink (e.g. InMemoryMetrics) to collect request timings.
     """
 
     # Fixed date range
     start_date = datetime(2026, 3, 20)
     end_date = datetime(2026, 3, 31)
 
-    client = AmadeusClient()
+    client = AmadeusClient(cache=get_response_cache(), cassette=cassette, metrics=metrics)
 
     all_days = []
     daily_raw = {}
 
-    current = start_date
-    while current <= end_date:
-        date_str = current.strftime("%Y-%m-%d")
+    dates = date_range(start_date, end_date)
+
+    if prepass_top_n:
+        dates = select_candidate_dates(client, "YYZ", "MAA", dates, prepass_top_n)
+
+    if scheduler is not None:
+        results, fresh_dates = fetch_days_scheduled(client, "YYZ", "MAA", dates, scheduler)
+    else:
+        results, fresh_dates = fetch_days(client, "YYZ", "MAA", dates), set()
 
-        raw = client.search_flights("YYZ", "MAA", date_str)
+    for date_str, raw in results:
 
         # Skip invalid responses
         if not raw or "errors" in raw:
-            current += timedelta(days=1)
             continue
 
-        carriers = raw.get("dictionaries", {}).get("carriers", {})
-        flights = extract_flights(raw, carriers)
-
-        # Exclude unwanted airlines globally
-        excluded = {"CX", "AI"}
-        flights = [
-            f for f in flights
-            if f["airline"].split(" — ")[0] not in excluded
-        ]
-
-        # Same filter as classic mode
-        flights = [f for f in flights if float(f["layover_hours"]) <= 6]
+        flights = prepare_day(date_str, raw)
 
+        # Feed the scheduler's volatility estimate with newly observed prices
+        if date_str in fresh_dates and flights:
+            record_price_observation(date_str, flights.min_price())
 
         all_days.append({"date": date_str, "flights": flights})
         daily_raw[date_str] = flights
 
-        current += timedelta(days=1)
-
     # If no valid days
     if not all_days:
         return (
@@ -125,8 +282,8 @@ def run_pipeline_llm_routed(user_request: str):
             "Try again later."
         )
 
-    # Compute best-day summary
-    summary = compute_best_day(all_days)
+    # Compute best-day summary (ranking weights from scoring.json, if present)
+    summary = compute_best_day(all_days, scoring=ScoringEngine.load())
 
     final_report = build_full_report(
     summary,
@@ -142,4 +299,40 @@ def run_pipeline_llm_routed(user_request: str):
     return final_report, best_day_ascii, top3_ascii, daily_ascii
 
 
+# ---------------------------------------------------------
+# ROUND-TRIP DATE MATRIX
+# ---------------------------------------------------------
+
+def run_date_matrix(departure_start: datetime, departure_end: datetime,
+                    return_start: datetime, return_end: datetime,
+                    origin: str = "YYZ", destination: str = "MAA",
+                    top_k: int = 5, cassette=None, metrics=None, approximate: bool = False):
+    """
+    Cheapest round trips over a departure × return window.
+    Every cell is searched unless approximate=True, which skips cells an
+    additive fare estimate rules out (fewer calls, may miss fares; see
+    DateMatrixSearch).
+    Returns (price_grid_ascii, best_combinations_ascii).
+    """
+    client = AmadeusClient(cache=get_response_cache(), cassette=cassette, metrics=metrics)
+
+    search = DateMatrixSearch(
+        client,
+        origin,
+        destination,
+        date_range(departure_start, departure_end),
+        date_range(return_start, return_end),
+        top_k=top_k,
+        approximate=approximate,
+    )
+    result = search.run()
+
+    total = len(result.grid) + len(result.empty) + len(result.pruned)
+    grid_ascii = (
+        f"📅 ROUND-TRIP PRICE GRID — {origin} ⇄ {destination} "
+        f"({result.searched} searched, {len(result.pruned)} of {total} not searched)\n\n"
+        + result.format_grid()
+    )
+    best_ascii = f"🏆 BEST {top_k} DATE COMBINATIONS\n\n" + result.format_best(top_k)
 
+    return grid_ascii, best_ascii
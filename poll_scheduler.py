@@ -0,0 +1,125 @@
+import json
+import os
+import time
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from core.processor import load_price_series
+
+POLL_STATE_FILE = "poll_schedule.json"
+
+BASE_INTERVAL_HOURS = 6.0
+MIN_INTERVAL_HOURS = 0.5
+MAX_INTERVAL_HOURS = 48.0
+
+# Relative price movement per day that halves the base interval (1%/day)
+VOLATILITY_REFERENCE = 0.01
+# Days to departure at which the departure factor is 1.0
+DEPARTURE_REFERENCE_DAYS = 14.0
+MIN_DEPARTURE_FACTOR = 0.25
+MAX_DEPARTURE_FACTOR = 4.0
+
+
+def estimate_volatility(points: List[List[float]]) -> Optional[float]:
+    """
+    Average relative price movement per day over the observed series:
+    sum(|p_i - p_i-1| / p_i-1) / span_in_days.
+    Returns None when there are fewer than two observations.
+    """
+    if not points or len(points) < 2:
+        return None
+
+    points = sorted(points)
+    moved = 0.0
+    for (_, prev), (_, cur) in zip(points, points[1:]):
+        if prev > 0:
+            moved += abs(cur - prev) / prev
+
+    span_days = max((points[-1][0] - points[0][0]) / 86400.0, 1.0 / 24)
+    return moved / span_days
+
+
+class PollScheduler:
+    """
+    Gives every tracked date its own refresh interval:
+
+        interval = BASE * departure_factor / (1 + volatility / VOLATILITY_REFERENCE)
+
+    - volatility comes from the price series recorded next to detect_price_drop
+    - departure_factor = days_to_departure / 14, clamped to [0.25, 4]
+    - dates with no history use the base interval scaled by departure only
+
+    Last-poll times persist in POLL_STATE_FILE so the schedule survives
+    between runs; due_dates() returns the dates worth spending API calls on.
+    """
+
+    def __init__(
+        self,
+        state_file: str = POLL_STATE_FILE,
+        base_interval_hours: float = BASE_INTERVAL_HOURS,
+        min_interval_hours: float = MIN_INTERVAL_HOURS,
+        max_interval_hours: float = MAX_INTERVAL_HOURS,
+    ):
+        self.state_file = state_file
+        self.base_interval_hours = base_interval_hours
+        self.min_interval_hours = min_interval_hours
+        self.max_interval_hours = max_interval_hours
+        self.last_polled: Dict[str, float] = self._load_state()
+
+    # ---------------------------------------------------------
+    # STATE
+    # ---------------------------------------------------------
+    def _load_state(self) -> Dict[str, float]:
+        if not os.path.exists(self.state_file):
+            return {}
+        try:
+            with open(self.state_file, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except Exception:
+            return {}
+
+    def _save_state(self) -> None:
+        with open(self.state_file, "w", encoding="utf-8") as f:
+            json.dump(self.last_polled, f)
+
+    # ---------------------------------------------------------
+    # INTERVALS
+    # ---------------------------------------------------------
+    def interval_hours(self, date_str: str, series: Optional[Dict[str, List[List[float]]]] = None,
+                       now: Optional[float] = None) -> float:
+        now = time.time() if now is None else now
+        series = load_price_series() if series is None else series
+
+        departure = datetime.strptime(date_str, "%Y-%m-%d").timestamp()
+        days_out = max(0.0, (departure - now) / 86400.0)
+        departure_factor = min(MAX_DEPARTURE_FACTOR,
+                               max(MIN_DEPARTURE_FACTOR, days_out / DEPARTURE_REFERENCE_DAYS))
+
+        volatility = estimate_volatility(series.get(date_str, []))
+        volatility_factor = 1.0 if volatility is None else 1.0 + volatility / VOLATILITY_REFERENCE
+
+        interval = self.base_interval_hours * departure_factor / volatility_factor
+        return min(self.max_interval_hours, max(self.min_interval_hours, interval))
+
+    def next_poll_at(self, date_str: str, series=None, now: Optional[float] = None) -> float:
+        """
+        Epoch seconds when `date_str` is next due (0 if never polled).
+        """
+        last = self.last_polled.get(date_str)
+        if last is None:
+            return 0.0
+        return last + self.interval_hours(date_str, series, now) * 3600
+
+    def due_dates(self, dates: List[str], now: Optional[float] = None) -> List[str]:
+        """
+        The subset of `dates` whose refresh interval has elapsed.
+        """
+        now = time.time() if now is None else now
+        series = load_price_series()
+        return [d for d in dates if self.next_poll_at(d, series, now) <= now]
+
+    def mark_polled(self, dates: List[str], now: Optional[float] = None) -> None:
+        now = time.time() if now is None else now
+        for date_str in dates:
+            self.last_polled[date_str] = now
+        self._save_state()
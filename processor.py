@@ -1,7 +1,14 @@
 from dataclasses import dataclass
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Iterable, Iterator, Tuple
+from datetime import datetime
+import bisect
+import heapq
 import json
 import os
+import threading
+
+from core.flight_table import FlightTable
+from core.scoring import DEFAULT_SCORING, ScoringEngine
 
 # ============================================================
 # DATA MODELS (for ASCII tables)
@@ -52,7 +59,11 @@ class OverallBestDay:
 # ============================================================
 
 PRICE_HISTORY_FILE = "price_history.json"
+PRICE_SERIES_FILE = "price_series.json"
+MAX_SERIES_POINTS = 50  # per date, oldest dropped first
 EXCLUDED_AIRLINES = {"CX", "AI"}  # Cathay Pacific, Air India
+TOP_OVERALL = 3  # flights in the "top overall" section
+PARETO_REPORT_LIMIT = 20  # frontier rows shown in the report, cheapest first
 
 
 # ============================================================
@@ -174,6 +185,34 @@ def _save_price_history(history: Dict[str, float]) -> None:
         json.dump(history, f)
 
 
+def load_price_series() -> Dict[str, List[List[float]]]:
+    """
+    Timestamped price observations per date: { date: [[epoch, price], ...] }.
+    """
+    if not os.path.exists(PRICE_SERIES_FILE):
+        return {}
+    try:
+        with open(PRICE_SERIES_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except Exception:
+        return {}
+
+
+def record_price_observation(date_str: str, price: float, observed_at: Optional[float] = None) -> None:
+    """
+    Appends one observation to the price series used for volatility estimates.
+    """
+    import time
+
+    series = load_price_series()
+    points = series.setdefault(date_str, [])
+    points.append([observed_at if observed_at is not None else time.time(), float(price)])
+    series[date_str] = points[-MAX_SERIES_POINTS:]
+
+    with open(PRICE_SERIES_FILE, "w", encoding="utf-8") as f:
+        json.dump(series, f)
+
+
 def detect_price_drop(date_str: str, current_price: float) -> Optional[str]:
     """
     Simple file-based price drop detection.
@@ -184,6 +223,7 @@ def detect_price_drop(date_str: str, current_price: float) -> Optional[str]:
 
     history[date_str] = float(current_price)
     _save_price_history(history)
+    record_price_observation(date_str, current_price)
 
     if prev_price is None:
         return None
@@ -202,179 +242,243 @@ def detect_price_drop(date_str: str, current_price: float) -> Optional[str]:
 # CORE BUSINESS LOGIC (COMPUTE BEST DAYS)
 # ============================================================
 
-def extract_flights(raw: Dict[str, Any], carrier_lookup: Dict[str, str]) -> List[Dict[str, Any]]:
+def _airline_label(code: str, carrier_lookup: Dict[str, str], labels: Dict[str, str]) -> str:
     """
-    Extracts normalized flight data from Amadeus flight-offer response.
+    "EY — ETIHAD AIRWAYS" for a carrier code, memoized in `labels`.
     """
-    if not raw or "data" not in raw:
-        return []
+    label = labels.get(code)
+    if label is None:
+        name = carrier_lookup.get(code, "")
+        label = labels[code] = f"{code} — {name}" if name else code
+    return label
 
-    flights: List[Dict[str, Any]] = []
 
-    for offer in raw["data"]:
-        try:
-            itineraries = offer.get("itineraries", [])
-            if not itineraries:
-                continue
+def _parse_time(at: str, times: Dict[str, datetime]) -> datetime:
+    """
+    Parses a segment timestamp, memoized in `times` (offers share segments).
+    """
+    parsed = times.get(at)
+    if parsed is None:
+        # fromisoformat reads "%Y-%m-%dT%H:%M:%S" far faster than strptime
+        parsed = times[at] = datetime.fromisoformat(at)
+    return parsed
 
-            # We only consider the first itinerary (outbound)
-            itin = itineraries[0]
-            segments = itin.get("segments", [])
-            if not segments:
-                continue
 
-            # Airline = carrier of first segment
-            airline_code = segments[0].get("carrierCode", "")
-            airline_name = carrier_lookup.get(airline_code, "")
-            airline = f"{airline_code} — {airline_name}" if airline_name else airline_code
+def _parse_itinerary(itin: Dict[str, Any], carrier_lookup: Dict[str, str],
+                     labels: Dict[str, str], times: Dict[str, datetime]) -> Optional[Dict[str, Any]]:
+    """
+    Normalizes one itinerary (outbound, return or multi-city leg),
+    or returns None if it has no segments.
+    """
+    segments = itin.get("segments", [])
+    if not segments:
+        return None
 
-            # Price
-            price = float(offer["price"]["total"])
+    # Airline = carrier of first segment
+    airline = _airline_label(segments[0].get("carrierCode", ""), carrier_lookup, labels)
 
-            # Total duration (PT17H50M → 17h 50m)
-            duration_iso = itin.get("duration", "")
-            duration = duration_iso.replace("PT", "").lower().replace("h", "h ").replace("m", "m")
+    # Total duration (PT17H50M → 17h 50m)
+    duration_iso = itin.get("duration", "")
+    duration = duration_iso.replace("PT", "").lower().replace("h", "h ").replace("m", "m")
 
-            # Stops
-            stops = len(segments) - 1
+    # Stops
+    stops = len(segments) - 1
 
-            # Layover city + hours
-            layover_city = ""
-            layover_hours = 0.0
+    # Layover city + hours
+    layover_city = ""
+    layover_hours = 0.0
 
-            if len(segments) > 1:
-                first_arrival = segments[0]["arrival"]["at"]
-                second_departure = segments[1]["departure"]["at"]
+    if len(segments) > 1:
+        t1 = _parse_time(segments[0]["arrival"]["at"], times)
+        t2 = _parse_time(segments[1]["departure"]["at"], times)
 
-                from datetime import datetime
-                fmt = "%Y-%m-%dT%H:%M:%S"
+        layover_hours = round((t2 - t1).total_seconds() / 3600, 1)
+        layover_city = segments[0]["arrival"]["iataCode"]
 
-                t1 = datetime.strptime(first_arrival, fmt)
-                t2 = datetime.strptime(second_departure, fmt)
+    return {
+        "airline": airline,
+        "origin": segments[0]["departure"].get("iataCode", ""),
+        "destination": segments[-1]["arrival"].get("iataCode", ""),
+        "duration": duration,
+        "stops": stops,
+        "layover_city": layover_city,
+        "layover_hours": layover_hours,
+        "departure": segments[0]["departure"]["at"],
+        "arrival": segments[-1]["arrival"]["at"],
+    }
 
-                layover_hours = round((t2 - t1).total_seconds() / 3600, 1)
-                layover_city = segments[0]["arrival"]["iataCode"]
 
-            # Departure / Arrival
-            departure = segments[0]["departure"]["at"]
-            arrival = segments[-1]["arrival"]["at"]
+def _parse_offer(offer: Dict[str, Any], carrier_lookup: Dict[str, str],
+                 labels: Optional[Dict[str, str]] = None,
+                 times: Optional[Dict[str, datetime]] = None) -> Optional[Dict[str, Any]]:
+    """
+    Normalizes one flight offer, or returns None if any itinerary has no segments.
+
+    Every itinerary is parsed into `legs` (one for one-way, two for a round
+    trip, N for multi-city). The top-level fields describe the outbound leg,
+    so one-way consumers are unaffected; `price` covers the whole offer.
+    """
+    itineraries = offer.get("itineraries", [])
+    if not itineraries:
+        return None
+
+    labels = {} if labels is None else labels
+    times = {} if times is None else times
+
+    legs = []
+    for itin in itineraries:
+        leg = _parse_itinerary(itin, carrier_lookup, labels, times)
+        if leg is None:
+            return None
+        legs.append(leg)
+
+    outbound = legs[0]
+
+    return {
+        "airline": outbound["airline"],
+        "price": float(offer["price"]["total"]),
+        "duration": outbound["duration"],
+        "stops": outbound["stops"],
+        "layover_city": outbound["layover_city"],
+        "layover_hours": outbound["layover_hours"],
+        "departure": outbound["departure"],
+        "arrival": outbound["arrival"],
+        "legs": legs,
+    }
 
-            flights.append({
-                "airline": airline,
-                "price": price,
-                "duration": duration,
-                "stops": stops,
-                "layover_city": layover_city,
-                "layover_hours": layover_hours,
-                "departure": departure,
-                "arrival": arrival,
-            })
 
+def iter_extract_flights(offers: Iterable[Dict[str, Any]], carrier_lookup: Dict[str, str]) -> Iterator[Dict[str, Any]]:
+    """
+    Yields normalized flights one offer at a time.
+    Works on a plain list or on an OfferStream still being downloaded.
+    Carrier labels and segment timestamps are decoded once per pass and
+    shared by every leg of every offer.
+    """
+    labels: Dict[str, str] = {}
+    times: Dict[str, datetime] = {}
+
+    for offer in offers:
+        try:
+            flight = _parse_offer(offer, carrier_lookup, labels, times)
         except Exception as e:
             print("Error parsing flight:", e)
             continue
 
+        if flight is not None:
+            yield flight
+
+
+def extract_flights(raw: Dict[str, Any], carrier_lookup: Dict[str, str]) -> List[Dict[str, Any]]:
+    """
+    Extracts normalized flight data from Amadeus flight-offer response.
+    """
+    if not raw or "data" not in raw:
+        return []
+
+    return list(iter_extract_flights(raw["data"], carrier_lookup))
+
+
+def apply_carrier_names(flights: List[Dict[str, Any]], carrier_lookup: Dict[str, str]) -> List[Dict[str, Any]]:
+    """
+    Fills in airline names for flights extracted before the carrier
+    dictionary was available (airline is still a bare code).
+    """
+    for f in flights:
+        for item in [f, *f.get("legs", [])]:
+            code = item["airline"]
+            name = carrier_lookup.get(code, "")
+            if name:
+                item["airline"] = f"{code} — {name}"
     return flights
 
 
-def compute_best_day(all_days: List[Dict[str, Any]]) -> Dict[str, Any]:
+def _as_table(flights) -> FlightTable:
+    return flights if isinstance(flights, FlightTable) else FlightTable.from_flights(flights)
+
+
+def _scan_day(table: FlightTable, top_n: int = TOP_OVERALL,
+              scoring: ScoringEngine = DEFAULT_SCORING) -> Tuple[int, int, int, List[Tuple[float, int]]]:
     """
-    all_days = [
-        { "date": "2026-03-20", "flights": [...] },
-        ...
-    ]
-    Returns structured summary + text_summary for Slack.
+    Rows of the cheapest flight, the shortest duration and the shortest
+    layover (first one on ties), plus the top_n (score, row) pairs from
+    `scoring` in score order. Works a whole column at a time.
+    """
+    return (
+        table.argmin("price"),
+        table.argmin("duration_minutes"),
+        table.argmin("layover_hours"),
+        scoring.top_k(table, top_n),
+    )
+
+
+def _summarize_days(days: Iterable[Tuple[str, FlightTable, Tuple]], top_n: int = TOP_OVERALL) -> Dict[str, Any]:
+    """
+    Combines per-day _scan_day results, in day order, into the
+    compute_best_day summary. Later days only win on a strictly better
+    value; equal scores keep day order, as a stable sort would.
     """
     cheapest = None
     shortest_duration = None
     shortest_layover = None
-    scored_flights: List[Dict[str, Any]] = []
-
-    for day in all_days:
-        date = day["date"]
-        flights = day["flights"]
-        if not flights:
-            continue
+    candidates: List[Tuple[float, int, int, str, FlightTable]] = []
 
-        # Normalize and compute helpers
-        norm_flights = []
-        for f in flights:
-            price_val = float(f["price"])
-            layover_val = float(f["layover_hours"])
-            duration_str = f["duration"]
-            duration_val = parse_duration_to_minutes(duration_str)
-
-            norm_flights.append({
-                **f,
-                "price_val": price_val,
-                "layover_val": layover_val,
-                "duration_val": duration_val,
-            })
+    for order, (date, table, (c, d, l, top)) in enumerate(days):
+        prices = table.price
+        layovers = table.layover_hours
 
         # Cheapest
-        flights_sorted_price = sorted(norm_flights, key=lambda x: x["price_val"])
-        cheapest_flight = flights_sorted_price[0]
-        if cheapest is None or cheapest_flight["price_val"] < cheapest["price"]:
+        if cheapest is None or prices[c] < cheapest["price"]:
             cheapest = {
                 "date": date,
-                "price": cheapest_flight["price_val"],
-                "airline": cheapest_flight["airline"],
-                "layover_city": cheapest_flight["layover_city"],
-                "layover_hours": cheapest_flight["layover_val"],
+                "price": prices[c],
+                "airline": table.airline_label(c),
+                "layover_city": table.city(c),
+                "layover_hours": layovers[c],
             }
 
         # Shortest duration
-        flights_sorted_duration = sorted(norm_flights, key=lambda x: x["duration_val"])
-        shortest_duration_flight = flights_sorted_duration[0]
-        shortest_duration_minutes = shortest_duration_flight["duration_val"]
-
         if (
             shortest_duration is None
-            or shortest_duration_minutes < shortest_duration["duration_minutes"]
+            or table.duration_minutes[d] < shortest_duration["duration_minutes"]
         ):
             shortest_duration = {
                 "date": date,
-                "price": shortest_duration_flight["price_val"],
-                "airline": shortest_duration_flight["airline"],
-                "duration": shortest_duration_flight["duration"],
-                "duration_minutes": shortest_duration_minutes,
-                "layover_city": shortest_duration_flight["layover_city"],
-                "layover_hours": shortest_duration_flight["layover_val"],
+                "price": prices[d],
+                "airline": table.airline_label(d),
+                "duration": table.duration_text(d),
+                "duration_minutes": table.duration_minutes[d],
+                "layover_city": table.city(d),
+                "layover_hours": layovers[d],
             }
 
         # Shortest layover
-        flights_sorted_layover = sorted(norm_flights, key=lambda x: x["layover_val"])
-        shortest_layover_flight = flights_sorted_layover[0]
         if (
             shortest_layover is None
-            or shortest_layover_flight["layover_val"] < shortest_layover["layover_hours"]
+            or layovers[l] < shortest_layover["layover_hours"]
         ):
             shortest_layover = {
                 "date": date,
-                "price": shortest_layover_flight["price_val"],
-                "airline": shortest_layover_flight["airline"],
-                "layover_city": shortest_layover_flight["layover_city"],
-                "layover_hours": shortest_layover_flight["layover_val"],
+                "price": prices[l],
+                "airline": table.airline_label(l),
+                "layover_city": table.city(l),
+                "layover_hours": layovers[l],
             }
 
-        # Scoring for top 3 overall
-        for f in norm_flights:
-            score = (
-                (f["price_val"] / 1000.0)
-                + (f["duration_val"] / 1000.0)
-                + (f["layover_val"] / 10.0)
-            )
-            scored_flights.append({
-                "date": date,
-                "score": score,
-                "price": f["price_val"],
-                "airline": f["airline"],
-                "duration": f["duration"],
-                "layover_city": f["layover_city"],
-                "layover_hours": f["layover_val"],
-            })
-
-    top3_sorted = sorted(scored_flights, key=lambda x: x["score"])[:3]
+        for score, i in top:
+            candidates.append((score, order, i, date, table))
+
+    top3_sorted = [
+        {
+            "date": date,
+            "score": score,
+            "price": table.price[i],
+            "airline": table.airline_label(i),
+            "duration": table.duration_text(i),
+            "layover_city": table.city(i),
+            "layover_hours": table.layover_hours[i],
+        }
+        for score, _, i, date, table in heapq.nsmallest(top_n, candidates, key=lambda c: c[:3])
+    ]
 
     # Slack text summary
     text_summary_parts = []
@@ -401,6 +505,197 @@ def compute_best_day(all_days: List[Dict[str, Any]]) -> Dict[str, Any]:
     }
 
 
+def compute_best_day(all_days: List[Dict[str, Any]], top_n: int = TOP_OVERALL,
+                     scoring: ScoringEngine = DEFAULT_SCORING) -> Dict[str, Any]:
+    """
+    all_days = [
+        { "date": "2026-03-20", "flights": [...] },   # list of dicts or a FlightTable
+        ...
+    ]
+    Returns structured summary + text_summary for Slack.
+    Top flights are ranked by `scoring` (default: price/1000 +
+    duration/1000 + layover/10); ties keep the first flight in day order.
+    """
+    days = []
+    for day in all_days:
+        table = _as_table(day["flights"])
+        if table:
+            days.append((day["date"], table, _scan_day(table, top_n, scoring)))
+    return _summarize_days(days, top_n)
+
+
+class BestDayAggregator:
+    """
+    Incremental compute_best_day for days that arrive one at a time:
+
+        agg = BestDayAggregator()
+        agg.add_day("2026-03-22", flights)     # as each fetch completes
+        agg.summary()                          # same shape as compute_best_day
+        agg.add_day("2026-03-22", refreshed)   # re-poll replaces the day
+        agg.retract_day("2026-03-22")
+
+    Each day is scanned once when added; summary() only merges the
+    per-day results (days x top_n), so a refresh never rescans the window.
+    Days are merged in date order, so ties resolve as compute_best_day
+    does on a date-ordered window, whatever order fetches finish in.
+    """
+
+    def __init__(self, top_n: int = TOP_OVERALL, scoring: ScoringEngine = DEFAULT_SCORING):
+        self.top_n = top_n
+        self.scoring = scoring
+        self._days: Dict[str, Tuple[FlightTable, Tuple]] = {}
+        self._summary: Optional[Dict[str, Any]] = None
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._days)
+
+    def __contains__(self, date: str):
+        return date in self._days
+
+    @property
+    def dates(self) -> List[str]:
+        return sorted(self._days)
+
+    def add_day(self, date: str, flights) -> None:
+        """
+        Adds a day, or replaces it if already present. An empty day is
+        the same as retracting it.
+        """
+        table = _as_table(flights)
+        if not table:
+            self.retract_day(date)
+            return
+
+        scan = _scan_day(table, self.top_n, self.scoring)
+        with self._lock:
+            self._days[date] = (table, scan)
+            self._summary = None
+
+    replace_day = add_day
+
+    def retract_day(self, date: str) -> bool:
+        """
+        Drops a day from the summary. Returns False if it wasn't there.
+        """
+        with self._lock:
+            if self._days.pop(date, None) is None:
+                return False
+            self._summary = None
+            return True
+
+    def table(self, date: str) -> Optional[FlightTable]:
+        entry = self._days.get(date)
+        return entry[0] if entry else None
+
+    def summary(self) -> Dict[str, Any]:
+        """
+        Current result; cached until the next add/replace/retract.
+        """
+        with self._lock:
+            if self._summary is None:
+                days = [(date, *self._days[date]) for date in sorted(self._days)]
+                self._summary = _summarize_days(days, self.top_n)
+            return self._summary
+
+    @property
+    def cheapest(self) -> Optional[Dict[str, Any]]:
+        return self.summary()["cheapest"]
+
+    @property
+    def shortest_duration(self) -> Optional[Dict[str, Any]]:
+        return self.summary()["shortest_duration"]
+
+    @property
+    def shortest_layover(self) -> Optional[Dict[str, Any]]:
+        return self.summary()["shortest_layover"]
+
+    @property
+    def top_overall(self) -> List[Dict[str, Any]]:
+        return self.summary()["top3_overall"]
+
+
+def _staircase_covers(staircase: Tuple[List[int], List[float]], duration: int, layover: float) -> bool:
+    durations, layovers = staircase
+    j = bisect.bisect_right(durations, duration) - 1
+    return j >= 0 and layovers[j] <= layover
+
+
+def _staircase_insert(staircase: Tuple[List[int], List[float]], duration: int, layover: float) -> None:
+    durations, layovers = staircase
+    j = bisect.bisect_left(durations, duration)
+    k = j
+    while k < len(layovers) and layovers[k] >= layover:
+        k += 1  # points the new one covers
+    durations[j:k] = [duration]
+    layovers[j:k] = [layover]
+
+
+def pareto_frontier(table: FlightTable) -> List[int]:
+    """
+    Rows no other flight dominates on (price, duration minutes, layover
+    hours, stops): nothing else is at least as good on all four and
+    better on one. Returned cheapest first; exact duplicates all stay.
+
+    Sort-and-sweep: after a lexicographic sort, anything that dominates
+    a row comes before it, so each row is only checked against the
+    frontier so far. Per stop count the frontier is kept as a staircase
+    (durations rising, layovers falling), so the check is one bisect per
+    stop count: O(n log n) overall.
+    """
+    price = table.price
+    duration = table.duration_minutes
+    layover = table.layover_hours
+    stops = table.stops
+
+    order = sorted(range(len(table)), key=lambda i: (price[i], duration[i], layover[i], stops[i]))
+
+    staircases: Dict[int, Tuple[List[int], List[float]]] = {}
+    frontier_keys = set()
+    frontier: List[int] = []
+
+    for i in order:
+        key = (price[i], duration[i], layover[i], stops[i])
+        if key not in frontier_keys:
+            if any(
+                _staircase_covers(staircase, duration[i], layover[i])
+                for s, staircase in staircases.items()
+                if s <= stops[i]
+            ):
+                continue
+            frontier_keys.add(key)
+            _staircase_insert(staircases.setdefault(stops[i], ([], [])), duration[i], layover[i])
+        frontier.append(i)
+
+    return frontier
+
+
+def compute_pareto_frontier(daily_raw: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Pareto frontier across every day (and route) in `daily_raw`
+    ({date: flights}, lists of dicts or FlightTables).
+    """
+    tables = [
+        flights if isinstance(flights, FlightTable) else FlightTable.from_flights(flights, date)
+        for date, flights in sorted(daily_raw.items())
+    ]
+    table = FlightTable.concat(tables)
+
+    return [
+        {
+            "date": table.date(i),
+            "price": table.price[i],
+            "airline": table.airline_label(i),
+            "duration": table.duration_text(i),
+            "duration_minutes": table.duration_minutes[i],
+            "stops": table.stops[i],
+            "layover_city": table.city(i),
+            "layover_hours": table.layover_hours[i],
+        }
+        for i in pareto_frontier(table)
+    ]
+
+
 # ============================================================
 # PARSERS INTO DATA MODELS
 # ============================================================
@@ -426,6 +721,22 @@ def parse_day_flights(date: str, raw_options: List[Dict[str, Any]]) -> DayFlight
     return DayFlights(date=date, options=options)
 
 
+def parse_day_table(date: str, table: FlightTable, limit: int = 10) -> DayFlights:
+    """
+    Like parse_day_flights, but only materializes the rows the daily
+    table will show (the first `limit` not in EXCLUDED_AIRLINES).
+    Option numbers still count every row.
+    """
+    options: List[FlightOption] = []
+    for i in range(len(table)):
+        if table.airline_code(i) in EXCLUDED_AIRLINES:
+            continue
+        options.append(parse_flight_option(i + 1, table.row(i)))
+        if len(options) == limit:
+            break
+    return DayFlights(date=date, options=options)
+
+
 def parse_best_day_category(raw: Dict[str, Any]) -> BestDayCategory:
     return BestDayCategory(
         category=raw.get("category", ""),
@@ -588,13 +899,50 @@ def build_top3_overall_section(overall_days_raw: List[Dict[str, Any]]) -> str:
     return "🌍 TOP 3 BEST OVERALL DAYS 🌍\n\n" + render_ascii_block(table)
 
 
+def build_pareto_section(frontier: List[Dict[str, Any]]) -> str:
+    """
+    Build the Pareto frontier section (compute_pareto_frontier output):
+    every flight worth considering on price, duration, layover and stops.
+    """
+    if not frontier:
+        return "No Pareto frontier available."
+
+    headers = ["#", "Date", "Price", "Airline", "Duration", "Layover", "Stops"]
+    rows = [
+        [
+            i,
+            f["date"],
+            f"{f['price']:.2f}",
+            f["airline"],
+            f["duration"],
+            f"{f['layover_hours']:.1f}h {f['layover_city']}" if f["layover_city"] else "—",
+            f["stops"],
+        ]
+        for i, f in enumerate(frontier[:PARETO_REPORT_LIMIT], start=1)
+    ]
+
+    widths = auto_column_widths(headers, rows)
+    aligns = ["right", "left", "right", "left", "left", "left", "right"]
+    table = make_table(headers, rows, widths, aligns)
+
+    section = "⚖️ PARETO FRONTIER — PRICE / DURATION / LAYOVER / STOPS ⚖️\n\n" + render_ascii_block(table)
+    if len(frontier) > PARETO_REPORT_LIMIT:
+        section += f"\n…and {len(frontier) - PARETO_REPORT_LIMIT} more non-dominated flights."
+    return section
+
+
 def build_daily_sections(daily_raw: Dict[str, List[Dict[str, Any]]]) -> str:
     """
     Build all daily sections (one table per date).
+    Values may be lists of flight dicts or FlightTables.
     """
     parts: List[str] = []
     for date in sorted(daily_raw.keys()):
-        day_flights = parse_day_flights(date, daily_raw[date])
+        flights = daily_raw[date]
+        if isinstance(flights, FlightTable):
+            day_flights = parse_day_table(date, flights)
+        else:
+            day_flights = parse_day_flights(date, flights)
         parts.append(build_daily_flights_table(day_flights))
         parts.append("")
     return "\n".join(parts).rstrip()
@@ -610,6 +958,7 @@ def build_full_report(
     Build the full report combining:
     - Best day summary
     - Top 3 overall days
+    - Pareto frontier
     - Etihad-only table (NEW)
     - Daily flight options
     """
@@ -630,6 +979,13 @@ def build_full_report(
     sections.append(overall_section)
     sections.append("")
 
+    # --------------------------------------------------------
+    # 2b. Pareto frontier (non-dominated trade-offs)
+    # --------------------------------------------------------
+    pareto_section = build_pareto_section(compute_pareto_frontier(daily_raw))
+    sections.append(pareto_section)
+    sections.append("")
+
     # --------------------------------------------------------
     # 3. NEW — Etihad-only table
     # --------------------------------------------------------
@@ -645,6 +1001,13 @@ def build_full_report(
     etihad_rows = []
 
     for date, flights in daily_raw.items():
+        if isinstance(flights, FlightTable):
+            # Match on the airline dictionary, then build only those rows
+            etihad = {
+                a for a, label in enumerate(flights.airlines.values) if "etihad" in label.lower()
+            }
+            flights = [flights.row(i) for i, a in enumerate(flights.airline) if a in etihad]
+
         for f in flights:
             airline_name = f["airline"].lower()
             airline_name = airline_name.replace("—", "-").replace("–", "-")
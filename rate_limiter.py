@@ -0,0 +1,239 @@
+import os
+import sqlite3
+import threading
+import time
+from contextlib import closing
+from datetime import datetime, timezone
+from typing import Dict, Optional
+
+from utils.logger import get_logger
+from utils.config import Config
+
+logger = get_logger(__name__)
+
+# Amadeus Self-Service test environment: 10 transactions / second
+DEFAULT_TPS = 10.0
+DEFAULT_BURST = 10
+# No client-side cap unless configured (Config.AMADEUS_DAILY_QUOTA /
+# AMADEUS_MONTHLY_QUOTA, or explicit limits)
+DEFAULT_DAILY_LIMIT = None
+DEFAULT_MONTHLY_LIMIT = None
+# Below this fraction of remaining quota, callers are told to back off
+LOW_QUOTA_FRACTION = 0.1
+
+QUOTA_FILE = ".amadeus_quota.sqlite"
+
+
+class RateLimitError(Exception):
+    """
+    Base class for client-side throttling signals.
+    """
+
+
+class QuotaExceededError(RateLimitError):
+    """
+    Raised instead of sending a request that would exceed the daily or
+    monthly quota. Callers should stop polling until the period rolls over.
+    """
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket: `rate` tokens per second, at most `burst` banked.
+
+    reserve() claims a token and returns how long the caller must wait
+    before using it, so the same bucket works for threads (time.sleep)
+    and asyncio (asyncio.sleep).
+    """
+
+    def __init__(self, rate: float = DEFAULT_TPS, burst: int = DEFAULT_BURST, clock=time.monotonic):
+        self.rate = float(rate)
+        self.burst = float(burst)
+        self._clock = clock
+
+        self._tokens = float(burst)
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+
+            # Going negative queues the caller behind earlier reservations
+            self._tokens -= 1.0
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def available(self) -> float:
+        """
+        Tokens banked right now (negative while callers are queued).
+        """
+        with self._lock:
+            elapsed = self._clock() - self._updated
+            return min(self.burst, self._tokens + elapsed * self.rate)
+
+    def acquire(self) -> None:
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+
+
+def _config_limit(name: str) -> Optional[int]:
+    value = getattr(Config, name, None)
+    return int(value) if value not in (None, "") else None
+
+
+class QuotaTracker:
+    """
+    Counts calls per API key (and endpoint) per UTC day and month in
+    SQLite, so every process sharing a key sees the same totals.
+    With no limits set nothing is counted or stored.
+    """
+
+    def __init__(
+        self,
+        daily_limit: Optional[int] = DEFAULT_DAILY_LIMIT,
+        monthly_limit: Optional[int] = DEFAULT_MONTHLY_LIMIT,
+        low_fraction: float = LOW_QUOTA_FRACTION,
+        path: str = QUOTA_FILE,
+    ):
+        self.daily_limit = daily_limit
+        self.monthly_limit = monthly_limit
+        self.low_fraction = low_fraction
+        self.path = path
+        self._warned_low = set()
+        if self.enabled:
+            self._init_db()
+
+    @classmethod
+    def from_config(cls, **kwargs) -> "QuotaTracker":
+        """
+        Limits from Config.AMADEUS_DAILY_QUOTA / AMADEUS_MONTHLY_QUOTA
+        (unset = unlimited).
+        """
+        return cls(
+            daily_limit=_config_limit("AMADEUS_DAILY_QUOTA"),
+            monthly_limit=_config_limit("AMADEUS_MONTHLY_QUOTA"),
+            **kwargs,
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self.daily_limit is not None or self.monthly_limit is not None
+
+    # ---------------------------------------------------------
+    # PERIODS / STORAGE
+    # ---------------------------------------------------------
+    @staticmethod
+    def _periods():
+        now = datetime.now(timezone.utc)
+        return f"D:{now:%Y-%m-%d}", f"M:{now:%Y-%m}"
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=5.0, isolation_level=None)
+
+    def _init_db(self) -> None:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with closing(self._connect()) as conn, conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS quota ("
+                " key TEXT NOT NULL,"
+                " period TEXT NOT NULL,"
+                " count INTEGER NOT NULL,"
+                " PRIMARY KEY (key, period))"
+            )
+
+    @staticmethod
+    def _count(conn, key: str, period: str) -> int:
+        row = conn.execute(
+            "SELECT count FROM quota WHERE key = ? AND period = ?", (key, period)
+        ).fetchone()
+        return row[0] if row else 0
+
+    # ---------------------------------------------------------
+    # PUBLIC API
+    # ---------------------------------------------------------
+    def consume(self, key: str) -> Dict[str, Optional[int]]:
+        """
+        Records one call for `key`, or raises QuotaExceededError if the
+        call would go over a limit. Returns the remaining quota.
+        """
+        if not self.enabled:
+            return self._remaining(0, 0)
+
+        day, month = self._periods()
+
+        with closing(self._connect()) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            used_day = self._count(conn, key, day)
+            used_month = self._count(conn, key, month)
+
+            if self.daily_limit is not None and used_day >= self.daily_limit:
+                conn.execute("ROLLBACK")
+                raise QuotaExceededError(f"Daily Amadeus quota of {self.daily_limit} calls used up")
+            if self.monthly_limit is not None and used_month >= self.monthly_limit:
+                conn.execute("ROLLBACK")
+                raise QuotaExceededError(f"Monthly Amadeus quota of {self.monthly_limit} calls used up")
+
+            for period in (day, month):
+                conn.execute(
+                    "INSERT INTO quota (key, period, count) VALUES (?, ?, 1)"
+                    " ON CONFLICT (key, period) DO UPDATE SET count = count + 1",
+                    (key, period),
+                )
+            conn.execute("COMMIT")
+
+        remaining = self._remaining(used_day + 1, used_month + 1)
+        if self._is_low(remaining) and key not in self._warned_low:
+            self._warned_low.add(key)
+            logger.warning(f"Amadeus quota running low: {remaining}")
+        return remaining
+
+    def remaining(self, key: str) -> Dict[str, Optional[int]]:
+        """
+        Remaining calls today and this month (None = unlimited).
+        """
+        if not self.enabled:
+            return self._remaining(0, 0)
+
+        day, month = self._periods()
+        with closing(self._connect()) as conn, conn:
+            return self._remaining(self._count(conn, key, day), self._count(conn, key, month))
+
+    def is_low(self, key: str) -> bool:
+        """
+        True once any limit is within low_fraction of being used up.
+        Callers should slow down or stop scheduling optional searches.
+        """
+        return self._is_low(self.remaining(key))
+
+    def fraction_left(self, remaining: Dict[str, Optional[int]]) -> float:
+        """
+        Share of the tightest limit still available (1.0 if unlimited).
+        """
+        fractions = [
+            remaining[period] / limit
+            for period, limit in (("daily", self.daily_limit), ("monthly", self.monthly_limit))
+            if limit
+        ]
+        return min(fractions) if fractions else 1.0
+
+    def _remaining(self, used_day: int, used_month: int) -> Dict[str, Optional[int]]:
+        return {
+            "daily": None if self.daily_limit is None else max(0, self.daily_limit - used_day),
+            "monthly": None if self.monthly_limit is None else max(0, self.monthly_limit - used_month),
+        }
+
+    def _is_low(self, remaining: Dict[str, Optional[int]]) -> bool:
+        for period, limit in (("daily", self.daily_limit), ("monthly", self.monthly_limit)):
+            left = remaining[period]
+            if left is not None and left <= limit * self.low_fraction:
+                return True
+        return False
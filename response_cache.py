@@ -0,0 +1,212 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from contextlib import closing
+from typing import Any, Dict, Optional
+
+from utils.logger import get_logger
+from api.json_codec import JsonCodec, get_default_codec
+
+logger = get_logger(__name__)
+
+RESPONSE_CACHE_FILE = ".amadeus_response_cache.sqlite"
+DEFAULT_TTL = 15 * 60           # flight quotes go stale quickly
+STALE_TTL = 24 * 60 * 60        # expired entries kept this long for fallback reads
+MAX_MEMORY_ENTRIES = 256
+MAX_DISK_ENTRIES = 5000
+
+
+def make_cache_key(url: str, params: Dict[str, Any]) -> str:
+    """
+    Stable key for a search: endpoint + every query parameter.
+    """
+    canonical = json.dumps({"url": url, "params": params}, sort_keys=True, default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """
+    Two-tier TTL cache for Amadeus search responses.
+
+    - Memory tier: LRU (OrderedDict), bounded by max_memory_entries.
+      Hits return the cached object itself, so callers must not mutate it.
+    - Disk tier: SQLite, bounded by max_disk_entries, shared across runs.
+      Expired rows are purged first, then the least recently used.
+
+    A disk hit is promoted back into memory.
+    Set disk_path=None for a memory-only cache.
+
+    Expired entries linger for `stale_ttl` so get(key, allow_stale=True)
+    can still serve them while the upstream is unavailable.
+    """
+
+    def __init__(
+        self,
+        ttl: float = DEFAULT_TTL,
+        max_memory_entries: int = MAX_MEMORY_ENTRIES,
+        disk_path: Optional[str] = RESPONSE_CACHE_FILE,
+        max_disk_entries: int = MAX_DISK_ENTRIES,
+        stale_ttl: float = STALE_TTL,
+        codec: JsonCodec = None,
+    ):
+        self.ttl = ttl
+        self.max_memory_entries = max_memory_entries
+        self.disk_path = disk_path
+        self.max_disk_entries = max_disk_entries
+        self.stale_ttl = stale_ttl
+        self.codec = codec or get_default_codec()
+
+        self._memory: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        if self.disk_path:
+            self._init_db()
+
+    # ---------------------------------------------------------
+    # PUBLIC API
+    # ---------------------------------------------------------
+    def get(self, key: str, allow_stale: bool = False) -> Optional[Any]:
+        """
+        Returns the cached value if fresh. With allow_stale=True, an expired
+        value still inside the stale window is returned too.
+        """
+        now = time.time()
+        # Oldest expiry that is still acceptable for this read
+        cutoff = now - self.stale_ttl if allow_stale else now
+
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > cutoff:
+                    self._memory.move_to_end(key)
+                    return value
+                if expires_at + self.stale_ttl <= now:
+                    del self._memory[key]
+
+        if not self.disk_path:
+            return None
+
+        row = self._disk_get(key, now, cutoff)
+        if row is None:
+            return None
+
+        expires_at, value = row
+        self._memory_put(key, value, expires_at)
+        return value
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        expires_at = time.time() + (self.ttl if ttl is None else ttl)
+        self._memory_put(key, value, expires_at)
+
+        if self.disk_path:
+            self._disk_put(key, value, expires_at)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._memory.pop(key, None)
+
+        if self.disk_path:
+            try:
+                with closing(self._connect()) as conn, conn:
+                    conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            except sqlite3.Error as e:
+                logger.warning(f"Response cache delete failed: {e}")
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+
+        if self.disk_path:
+            try:
+                with closing(self._connect()) as conn, conn:
+                    conn.execute("DELETE FROM responses")
+            except sqlite3.Error as e:
+                logger.warning(f"Response cache clear failed: {e}")
+
+    # ---------------------------------------------------------
+    # MEMORY TIER
+    # ---------------------------------------------------------
+    def _memory_put(self, key: str, value: Any, expires_at: float) -> None:
+        with self._lock:
+            self._memory[key] = (expires_at, value)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_memory_entries:
+                self._memory.popitem(last=False)
+
+    # ---------------------------------------------------------
+    # DISK TIER
+    # ---------------------------------------------------------
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.disk_path, timeout=5.0)
+
+    def _init_db(self) -> None:
+        directory = os.path.dirname(self.disk_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with closing(self._connect()) as conn, conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                " key TEXT PRIMARY KEY,"
+                " payload BLOB NOT NULL,"
+                " expires_at REAL NOT NULL,"
+                " accessed_at REAL NOT NULL)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed_at)"
+            )
+
+    def _disk_get(self, key: str, now: float, cutoff: float):
+        try:
+            with closing(self._connect()) as conn, conn:
+                row = conn.execute(
+                    "SELECT payload, expires_at FROM responses WHERE key = ?",
+                    (key,),
+                ).fetchone()
+                if row is None:
+                    return None
+                if row[1] + self.stale_ttl <= now:
+                    conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                    return None
+                if row[1] <= cutoff:
+                    return None
+                conn.execute(
+                    "UPDATE responses SET accessed_at = ? WHERE key = ?",
+                    (now, key),
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Response cache read failed: {e}")
+            return None
+
+        return row[1], self.codec.loads(row[0])
+
+    def _disk_put(self, key: str, value: Any, expires_at: float) -> None:
+        now = time.time()
+        try:
+            with closing(self._connect()) as conn, conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, payload, expires_at, accessed_at)"
+                    " VALUES (?, ?, ?, ?)",
+                    (key, self.codec.dumps(value), expires_at, now),
+                )
+                self._evict(conn, now)
+        except sqlite3.Error as e:
+            logger.warning(f"Response cache write failed: {e}")
+
+    def _evict(self, conn: sqlite3.Connection, now: float) -> None:
+        conn.execute("DELETE FROM responses WHERE expires_at <= ?", (now - self.stale_ttl,))
+
+        (count,) = conn.execute("SELECT COUNT(*) FROM responses").fetchone()
+        overflow = count - self.max_disk_entries
+        if overflow > 0:
+            conn.execute(
+                "DELETE FROM responses WHERE key IN ("
+                " SELECT key FROM responses ORDER BY accessed_at ASC LIMIT ?)",
+                (overflow,),
+            )
@@ -0,0 +1,83 @@
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+# Throttled or transient upstream failures worth another attempt
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+DEFAULT_MAX_ATTEMPTS = 4
+DEFAULT_BASE_DELAY = 0.5
+DEFAULT_MAX_DELAY = 20.0
+DEFAULT_BUDGET = 45.0
+DEFAULT_REQUEST_TIMEOUT = 20.0
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parses a Retry-After header (delta-seconds or HTTP-date) into seconds.
+    """
+    if not value:
+        return None
+
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class RetryPolicy:
+    """
+    Exponential backoff with full jitter, bounded by a per-request time budget.
+
+    - attempt n sleeps uniform(0, min(max_delay, base_delay * 2**(n-1)))
+    - a Retry-After from the server wins over the computed delay
+      (plus a little jitter so throttled callers don't return in lockstep)
+    - no retry is scheduled if it would end after the budget deadline
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        base_delay: float = DEFAULT_BASE_DELAY,
+        max_delay: float = DEFAULT_MAX_DELAY,
+        budget: float = DEFAULT_BUDGET,
+        request_timeout: float = DEFAULT_REQUEST_TIMEOUT,
+    ):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.budget = budget
+        self.request_timeout = request_timeout
+
+    def deadline(self) -> float:
+        return time.monotonic() + self.budget
+
+    def timeout_for(self, deadline: float) -> float:
+        """
+        Per-attempt timeout that never runs past the deadline.
+        """
+        return max(0.1, min(self.request_timeout, deadline - time.monotonic()))
+
+    def next_delay(self, attempt: int, deadline: float, retry_after: Optional[float] = None) -> Optional[float]:
+        """
+        Seconds to sleep before the next attempt, or None to give up.
+        `attempt` is the number of attempts already made (1-based).
+        """
+        if attempt >= self.max_attempts:
+            return None
+
+        if retry_after is not None:
+            delay = retry_after + random.uniform(0, self.base_delay)
+        else:
+            delay = random.uniform(0, min(self.max_delay, self.base_delay * (2 ** (attempt - 1))))
+
+        if time.monotonic() + delay >= deadline:
+            return None
+        return delay
@@ -0,0 +1,234 @@
+import heapq
+import json
+import os
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # optional: pure-Python scoring fallback
+    np = None
+
+from core.flight_table import FlightTable
+
+SCORING_CONFIG_FILE = "scoring.json"
+
+# Default weight and scale per criterion. Every term is
+# weight * value / scale (lower is better), so the defaults reproduce the
+# original formula: price/1000 + duration/1000 + layover/10.
+# Scales are fixed rather than min-max per table, so scores stay
+# comparable across days and routes (per-day top-k lists are merged).
+DEFAULT_WEIGHTS = {
+    "price": 1.0,
+    "duration": 1.0,
+    "layover": 1.0,
+    "stops": 0.0,
+    "departure_time": 0.0,
+    "airline": 0.0,
+}
+DEFAULT_SCALES = {
+    "price": 1000.0,           # dollars
+    "duration": 1000.0,        # minutes
+    "layover": 10.0,           # hours
+    "stops": 1.0,
+    "departure_time": 12.0,    # hours away from the preferred hour (0..12)
+    "airline": 1.0,            # preference value as configured
+}
+DEFAULT_DEPARTURE_HOUR = 10
+
+
+class Criterion:
+    """
+    One named score term: weight * value / scale, lower is better.
+    Subclasses return a whole column of raw values for a table.
+    """
+
+    def __init__(self, name: str, weight: float = 1.0, scale: float = 1.0):
+        self.name = name
+        self.weight = weight
+        self.scale = scale
+
+    def values(self, table: FlightTable):
+        raise NotImplementedError
+
+    def vector(self, table: FlightTable):
+        return self.weight * (np.asarray(self.values(table), dtype=np.float64) / self.scale)
+
+    def terms(self, table: FlightTable) -> List[float]:
+        weight, scale = self.weight, self.scale
+        return [weight * (value / scale) for value in self.values(table)]
+
+
+class ColumnCriterion(Criterion):
+    """
+    A FlightTable column used as is (price, duration_minutes, ...).
+    """
+
+    def __init__(self, name: str, column: str, weight: float = 1.0, scale: float = 1.0):
+        super().__init__(name, weight, scale)
+        self.column = column
+
+    def values(self, table: FlightTable):
+        return table.numpy(self.column) if np is not None else getattr(table, self.column)
+
+
+class DepartureTimeCriterion(Criterion):
+    """
+    Hours between the local departure time and `preferred_hour`, going
+    round the clock (a 23:00 departure is 1h from a 00:00 preference).
+    """
+
+    def __init__(self, preferred_hour: float = DEFAULT_DEPARTURE_HOUR, weight: float = 1.0,
+                 scale: float = DEFAULT_SCALES["departure_time"]):
+        super().__init__("departure_time", weight, scale)
+        self.preferred_hour = preferred_hour
+
+    def values(self, table: FlightTable):
+        if np is not None:
+            hours = (table.numpy("departure_epoch") % 86400) / 3600.0
+            gap = np.abs(hours - self.preferred_hour) % 24
+            return np.minimum(gap, 24 - gap)
+
+        out = []
+        for epoch in table.departure_epoch:
+            gap = abs((epoch % 86400) / 3600.0 - self.preferred_hour) % 24
+            out.append(min(gap, 24 - gap))
+        return out
+
+
+class AirlinePreferenceCriterion(Criterion):
+    """
+    Per-carrier value by airline code: negative for preferred carriers,
+    positive for ones to avoid, 0 (the default) for the rest. Looked up
+    once per distinct airline, then gathered through the airline column.
+    """
+
+    def __init__(self, preferences: Dict[str, float], weight: float = 1.0,
+                 scale: float = DEFAULT_SCALES["airline"]):
+        super().__init__("airline", weight, scale)
+        self.preferences = dict(preferences)
+
+    def values(self, table: FlightTable):
+        by_airline = [float(self.preferences.get(code, 0.0)) for code in table.airline_codes]
+        if np is not None:
+            if not by_airline:
+                return np.empty(0)
+            return np.asarray(by_airline)[table.numpy("airline")]
+        return [by_airline[a] for a in table.airline]
+
+
+class ScoringEngine:
+    """
+    Ranks FlightTable rows by a weighted sum of named criteria.
+
+        engine = ScoringEngine.load()          # scoring.json, else defaults
+        engine.top_k(table, 3)                 # [(score, row), ...]
+
+    With numpy installed every criterion is evaluated over whole columns
+    and top_k uses argpartition; without it the same scores are computed
+    in Python and selected with a bounded heap. Either way ties keep row
+    order, and the default weights give exactly the original scores.
+
+    scoring.json (every key optional):
+
+        {
+          "weights": {"price": 1, "duration": 1, "layover": 1, "stops": 0.2,
+                      "departure_time": 0.1, "airline": 1},
+          "scales": {"price": 1000},
+          "preferred_departure_hour": 9,
+          "airline_preferences": {"EY": -0.3, "LH": 0.2}
+        }
+    """
+
+    def __init__(self, criteria: Iterable[Criterion]):
+        # Zero-weight criteria cost nothing
+        self.criteria = [c for c in criteria if c.weight]
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]] = None) -> "ScoringEngine":
+        config = config or {}
+        unknown = set(config.get("weights", {})) - set(DEFAULT_WEIGHTS)
+        if unknown:
+            raise ValueError(f"Unknown scoring criteria: {', '.join(sorted(unknown))}")
+
+        weights = dict(DEFAULT_WEIGHTS, **config.get("weights", {}))
+        scales = dict(DEFAULT_SCALES, **config.get("scales", {}))
+
+        return cls([
+            ColumnCriterion("price", "price", weights["price"], scales["price"]),
+            ColumnCriterion("duration", "duration_minutes", weights["duration"], scales["duration"]),
+            ColumnCriterion("layover", "layover_hours", weights["layover"], scales["layover"]),
+            ColumnCriterion("stops", "stops", weights["stops"], scales["stops"]),
+            DepartureTimeCriterion(
+                config.get("preferred_departure_hour", DEFAULT_DEPARTURE_HOUR),
+                weights["departure_time"],
+                scales["departure_time"],
+            ),
+            AirlinePreferenceCriterion(
+                config.get("airline_preferences", {}),
+                weights["airline"],
+                scales["airline"],
+            ),
+        ])
+
+    @classmethod
+    def load(cls, path: str = SCORING_CONFIG_FILE) -> "ScoringEngine":
+        """
+        Engine from a JSON config file; the default weights if it's missing.
+        """
+        if not os.path.exists(path):
+            return cls.from_config()
+        with open(path, "r", encoding="utf-8") as f:
+            return cls.from_config(json.load(f))
+
+    # ---------------------------------------------------------
+    # SCORING
+    # ---------------------------------------------------------
+    def scores(self, table: FlightTable):
+        """
+        Score of every row: a numpy array, or a list without numpy.
+        """
+        n = len(table)
+        if np is not None:
+            total = np.zeros(n)
+            for i, criterion in enumerate(self.criteria):
+                total = criterion.vector(table) if i == 0 else total + criterion.vector(table)
+            return total
+
+        total = [0.0] * n
+        for i, criterion in enumerate(self.criteria):
+            terms = criterion.terms(table)
+            total = terms if i == 0 else [a + b for a, b in zip(total, terms)]
+        return total
+
+    def top_k(self, table: FlightTable, k: int) -> List[Tuple[float, int]]:
+        """
+        The k best (score, row) pairs, best first; equal scores keep row order.
+        """
+        n = len(table)
+        if not n or k <= 0:
+            return []
+
+        scores = self.scores(table)
+        if np is None:
+            rows = heapq.nsmallest(k, range(n), key=scores.__getitem__)
+            return [(scores[i], i) for i in rows]
+
+        if k < n:
+            # argpartition finds the k-th score in O(n); every row up to
+            # it (ties included) is then ordered stably by score
+            kth = scores[np.argpartition(scores, k - 1)[:k]].max()
+            candidates = np.flatnonzero(scores <= kth)
+        else:
+            candidates = np.arange(n)
+        rows = candidates[np.argsort(scores[candidates], kind="stable")][:k]
+        return [(float(scores[i]), int(i)) for i in rows]
+
+    def rank(self, table: FlightTable, k: int) -> List[Dict[str, Any]]:
+        """
+        top_k as flight dicts (with `score`), e.g. over
+        FlightTable.concat() of many routes and dates.
+        """
+        return [dict(table.row(i), date=table.date(i), score=score) for score, i in self.top_k(table, k)]
+
+
+DEFAULT_SCORING = ScoringEngine.from_config()
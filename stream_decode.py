@@ -0,0 +1,236 @@
+import codecs
+import json
+from collections import deque
+from typing import Any, Dict, Iterable, Iterator, List
+
+# Drop consumed text from the buffer once this many characters have been read
+_COMPACT_AT = 64 * 1024
+
+_WHITESPACE = " \t\r\n"
+# A number followed by one of these may continue in the next chunk
+# ("1" + "e5", "1." + "5")
+_NUMBER_CHARS = "0123456789+-.eE"
+
+# Parser states
+_START = "start"
+_KEY = "key"
+_COLON = "colon"
+_VALUE = "value"
+_ITEM = "item"
+_ITEM_SEP = "item_sep"
+_AFTER_VALUE = "after_value"
+_DONE = "done"
+
+
+class StreamDecodeError(ValueError):
+    """
+    Raised when the body is not a JSON object or ends mid-document.
+    """
+
+
+class OfferDecoder:
+    """
+    Push-based incremental decoder for a flight-offers response body.
+
+    Bytes go in through feed(); each element of the top-level `array_key`
+    array ("data") comes back as soon as its closing brace has arrived.
+    Every other top-level member (meta, dictionaries, errors) is decoded
+    whole into `extras`. Only the unparsed tail is kept in memory.
+    """
+
+    def __init__(self, array_key: str = "data"):
+        self.array_key = array_key
+        self.extras: Dict[str, Any] = {}
+
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._json = json.JSONDecoder()
+        self._buf = ""
+        self._pos = 0
+        self._state = _START
+        self._key = None
+
+    @property
+    def done(self) -> bool:
+        return self._state == _DONE
+
+    def feed(self, chunk: bytes, final: bool = False) -> List[Any]:
+        """
+        Adds bytes and returns every array element completed by them.
+        Pass final=True with the last chunk to validate the document end.
+        """
+        try:
+            self._buf += self._utf8.decode(chunk, final)
+        except UnicodeDecodeError as e:
+            raise StreamDecodeError(f"Response body is not valid UTF-8: {e}") from e
+        items: List[Any] = []
+
+        while self._step(items, final):
+            pass
+
+        if self._pos > _COMPACT_AT:
+            self._buf = self._buf[self._pos:]
+            self._pos = 0
+
+        if final and self._state != _DONE:
+            raise StreamDecodeError("Response body ended before the JSON document was complete")
+        return items
+
+    # ---------------------------------------------------------
+    # STATE MACHINE
+    # ---------------------------------------------------------
+    def _skip_ws(self) -> bool:
+        buf, pos = self._buf, self._pos
+        while pos < len(buf) and buf[pos] in _WHITESPACE:
+            pos += 1
+        self._pos = pos
+        return pos < len(buf)
+
+    def _expect(self, chars: str) -> str:
+        ch = self._buf[self._pos]
+        if ch not in chars:
+            raise StreamDecodeError(f"Unexpected {ch!r} at offset {self._pos}")
+        self._pos += 1
+        return ch
+
+    def _decode_value(self, final: bool):
+        """
+        Decodes one complete JSON value at the cursor, or returns
+        (False, None) if more input is needed.
+        """
+        buf = self._buf
+        try:
+            value, end = self._json.raw_decode(buf, self._pos)
+        except json.JSONDecodeError as e:
+            if final:
+                raise StreamDecodeError(f"Invalid JSON at offset {e.pos}: {e.msg}") from e
+            return False, None
+
+        # A bare number may still be growing: raw_decode stops at the end of
+        # the buffer, or before a dangling exponent / decimal point
+        if not final and type(value) in (int, float) and (end == len(buf) or buf[end] in _NUMBER_CHARS):
+            return False, None
+
+        self._pos = end
+        return True, value
+
+    def _step(self, items: List[Any], final: bool) -> bool:
+        if self._state == _DONE or not self._skip_ws():
+            return False
+
+        state = self._state
+
+        if state == _START:
+            self._expect("{")
+            self._state = _KEY
+        elif state == _KEY:
+            if self._buf[self._pos] == "}":
+                self._pos += 1
+                self._state = _DONE
+                return True
+            ok, key = self._decode_value(final)
+            if not ok:
+                return False
+            self._key = key
+            self._state = _COLON
+        elif state == _COLON:
+            self._expect(":")
+            self._state = _VALUE
+        elif state == _VALUE:
+            if self._key == self.array_key and self._buf[self._pos] == "[":
+                self._pos += 1
+                self._state = _ITEM
+                return True
+            ok, value = self._decode_value(final)
+            if not ok:
+                return False
+            self.extras[self._key] = value
+            self._state = _AFTER_VALUE
+        elif state == _ITEM:
+            if self._buf[self._pos] == "]":
+                self._pos += 1
+                self._state = _AFTER_VALUE
+                return True
+            ok, item = self._decode_value(final)
+            if not ok:
+                return False
+            items.append(item)
+            self._state = _ITEM_SEP
+        elif state == _ITEM_SEP:
+            self._state = _ITEM if self._expect(",]") == "," else _AFTER_VALUE
+        elif state == _AFTER_VALUE:
+            self._state = _KEY if self._expect(",}") == "," else _DONE
+
+        return True
+
+
+class OfferStream:
+    """
+    Iterates flight offers from a chunked response body as they arrive.
+
+    The carrier dictionary is resolved lazily: reading `carriers` consumes
+    just enough of the body to reach `dictionaries` (Amadeus sends it after
+    `data`), buffering any offers not yet iterated so none are lost.
+
+    The connection is released once the body is fully read or fails to
+    decode; use it as a context manager to release it early too:
+
+        with client.search_flights_stream(...) as offers:
+            first = next(iter(offers))
+    """
+
+    def __init__(self, chunks: Iterable[bytes], array_key: str = "data", on_close=None):
+        self._chunks = iter(chunks)
+        self._decoder = OfferDecoder(array_key)
+        self._pending = deque()
+        self._exhausted = False
+        self._on_close = on_close
+
+    def __enter__(self) -> "OfferStream":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __iter__(self) -> Iterator[Any]:
+        while True:
+            while self._pending:
+                yield self._pending.popleft()
+            if self._exhausted:
+                return
+            self._pull()
+
+    def _pull(self) -> None:
+        try:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                self._exhausted = True
+                self._pending.extend(self._decoder.feed(b"", final=True))
+                self.close()
+                return
+            self._pending.extend(self._decoder.feed(chunk))
+        except Exception:
+            self._exhausted = True
+            self.close()
+            raise
+
+    def _read_until(self, key: str) -> None:
+        while key not in self._decoder.extras and not self._exhausted:
+            self._pull()
+
+    @property
+    def carriers(self) -> Dict[str, str]:
+        self._read_until("dictionaries")
+        return self._decoder.extras.get("dictionaries", {}).get("carriers", {})
+
+    @property
+    def errors(self):
+        """
+        Error list for failed searches. Only known once the body is read.
+        """
+        self._read_until("errors")
+        return self._decoder.extras.get("errors")
+
+    def close(self) -> None:
+        if self._on_close is not None:
+            self._on_close()
+            self._on_close = None
@@ -0,0 +1,175 @@
+import random
+
+import pytest
+
+import core.flight_table
+import core.scoring
+from core.flight_table import FlightTable
+from core.processor import (
+    BestDayAggregator,
+    compute_best_day,
+    compute_pareto_frontier,
+    parse_duration_to_minutes,
+    pareto_frontier,
+)
+
+AIRLINES = ["EY — ETIHAD AIRWAYS", "QR — QATAR AIRWAYS", "LH — LUFTHANSA", "AC — AIR CANADA"]
+DURATIONS = ["10h 0m", "12h 30m", "20h 5m", "9h 55m"]
+
+
+@pytest.fixture(params=["numpy", "pure-python"])
+def backend(request, monkeypatch):
+    if request.param == "numpy":
+        if core.flight_table.np is None:
+            pytest.skip("numpy is not installed")
+    else:
+        monkeypatch.setattr(core.flight_table, "np", None)
+        monkeypatch.setattr(core.scoring, "np", None)
+    return request.param
+
+
+def _reference_best_day(all_days):
+    """
+    The original sort-based compute_best_day: per-day stable sorts for the
+    category winners, one stable sort of every scored flight for the top 3.
+    """
+    cheapest = shortest_duration = shortest_layover = None
+    scored = []
+
+    for day in all_days:
+        date, flights = day["date"], day["flights"]
+        if not flights:
+            continue
+
+        norm = [dict(f, price_val=float(f["price"]), layover_val=float(f["layover_hours"]),
+                     duration_val=parse_duration_to_minutes(f["duration"])) for f in flights]
+
+        f = sorted(norm, key=lambda x: x["price_val"])[0]
+        if cheapest is None or f["price_val"] < cheapest["price"]:
+            cheapest = {"date": date, "price": f["price_val"], "airline": f["airline"],
+                        "layover_city": f["layover_city"], "layover_hours": f["layover_val"]}
+
+        f = sorted(norm, key=lambda x: x["duration_val"])[0]
+        if shortest_duration is None or f["duration_val"] < shortest_duration["duration_minutes"]:
+            shortest_duration = {"date": date, "price": f["price_val"], "airline": f["airline"],
+                                 "duration": f["duration"], "duration_minutes": f["duration_val"],
+                                 "layover_city": f["layover_city"], "layover_hours": f["layover_val"]}
+
+        f = sorted(norm, key=lambda x: x["layover_val"])[0]
+        if shortest_layover is None or f["layover_val"] < shortest_layover["layover_hours"]:
+            shortest_layover = {"date": date, "price": f["price_val"], "airline": f["airline"],
+                                "layover_city": f["layover_city"], "layover_hours": f["layover_val"]}
+
+        for f in norm:
+            score = f["price_val"] / 1000.0 + f["duration_val"] / 1000.0 + f["layover_val"] / 10.0
+            scored.append({"date": date, "score": score, "price": f["price_val"], "airline": f["airline"],
+                           "duration": f["duration"], "layover_city": f["layover_city"],
+                           "layover_hours": f["layover_val"]})
+
+    return {
+        "cheapest": cheapest,
+        "shortest_duration": shortest_duration,
+        "shortest_layover": shortest_layover,
+        "top3_overall": sorted(scored, key=lambda x: x["score"])[:3],
+    }
+
+
+def _random_window(rng):
+    # Few distinct values, so prices, durations, layovers and scores tie often
+    days = []
+    for d in range(rng.randint(1, 6)):
+        flights = [
+            {
+                "airline": rng.choice(AIRLINES),
+                "price": float(rng.choice([100, 150, 200, 300])),
+                "duration": rng.choice(DURATIONS),
+                "stops": 1,
+                "layover_city": rng.choice(["DOH", "AUH", ""]),
+                "layover_hours": rng.choice([0.0, 1.0, 2.5, 3.0]),
+                "departure": "2026-03-20T10:00:00",
+                "arrival": "2026-03-21T10:00:00",
+            }
+            for _ in range(rng.choice([0, 0, 1, 2, 5, 12, 40]))
+        ]
+        days.append({"date": f"2026-03-{20 + d}", "flights": flights})
+    return days
+
+
+def _comparable(summary):
+    return {key: summary[key] for key in ("cheapest", "shortest_duration", "shortest_layover", "top3_overall")}
+
+
+def test_compute_best_day_matches_reference(backend):
+    rng = random.Random(7)
+    for trial in range(300):
+        days = _random_window(rng)
+        expected = _reference_best_day(days)
+
+        assert _comparable(compute_best_day(days)) == expected, trial
+
+        tables = [{"date": d["date"], "flights": FlightTable.from_flights(d["flights"])} for d in days]
+        assert _comparable(compute_best_day(tables)) == expected, trial
+
+
+def test_aggregator_matches_reference_in_any_arrival_order(backend):
+    rng = random.Random(11)
+    for trial in range(100):
+        days = _random_window(rng)
+        aggregator = BestDayAggregator()
+        for day in rng.sample(days, len(days)):
+            aggregator.add_day(day["date"], day["flights"])
+
+        assert _comparable(aggregator.summary()) == _reference_best_day(days), trial
+
+
+def test_empty_window(backend):
+    summary = compute_best_day([{"date": "2026-03-20", "flights": []}])
+    assert _comparable(summary) == _reference_best_day([])
+    assert summary["text_summary"] == ""
+
+
+def _brute_force_frontier(table):
+    points = [
+        (table.price[i], table.duration_minutes[i], table.layover_hours[i], table.stops[i])
+        for i in range(len(table))
+    ]
+
+    def dominates(a, b):
+        return a != b and all(x <= y for x, y in zip(a, b))
+
+    return sorted(i for i, p in enumerate(points) if not any(dominates(q, p) for q in points))
+
+
+def test_pareto_frontier_matches_brute_force():
+    rng = random.Random(3)
+    for trial in range(500):
+        # Tiny value ranges: exact duplicates and ties on single axes
+        flights = [
+            {
+                "airline": rng.choice(AIRLINES),
+                "price": float(rng.choice([100, 110, 120, 130])),
+                "duration": rng.choice(["10h 0m", "11h 0m", "12h 0m"]),
+                "stops": rng.choice([0, 1, 2]),
+                "layover_city": "DOH",
+                "layover_hours": rng.choice([0.0, 1.0, 2.0]),
+            }
+            for _ in range(rng.randint(0, 40))
+        ]
+        table = FlightTable.from_flights(flights)
+        frontier = pareto_frontier(table)
+
+        assert sorted(frontier) == _brute_force_frontier(table), trial
+        assert [table.price[i] for i in frontier] == sorted(table.price[i] for i in frontier), trial
+
+
+def test_pareto_frontier_keeps_duplicates_and_single_axis_ties():
+    flights = [
+        {"airline": "A", "price": 100.0, "duration": "10h 0m", "stops": 1, "layover_city": "DOH", "layover_hours": 2.0},
+        {"airline": "B", "price": 100.0, "duration": "10h 0m", "stops": 1, "layover_city": "DOH", "layover_hours": 2.0},
+        # Same price, worse duration: dominated
+        {"airline": "C", "price": 100.0, "duration": "11h 0m", "stops": 1, "layover_city": "DOH", "layover_hours": 2.0},
+        # Same duration, dearer but fewer stops: kept
+        {"airline": "D", "price": 120.0, "duration": "10h 0m", "stops": 0, "layover_city": "", "layover_hours": 0.0},
+    ]
+    frontier = compute_pareto_frontier({"2026-03-20": flights})
+    assert [f["airline"] for f in frontier] == ["A", "B", "D"]
@@ -0,0 +1,90 @@
+import json
+
+import pytest
+
+from api.stream_decode import OfferDecoder, OfferStream, StreamDecodeError
+
+DOCUMENTS = [
+    {"data": [1], "x": 1e5},
+    {"data": [1.5, -2, 3e-2, 0], "meta": {"count": 4}, "n": -12.25E+3},
+    {"data": [], "errors": [{"status": 400, "detail": "bad \"date\""}]},
+    {
+        "meta": {"count": 2},
+        "data": [
+            {"id": "1", "price": {"total": "812.40"}, "itineraries": [{"duration": "PT22H30M"}]},
+            {"id": "2", "price": {"total": "1012.00"}, "note": "Zürich → Chennai ✈"},
+        ],
+        "dictionaries": {"carriers": {"EY": "ETIHAD AIRWAYS"}},
+    },
+]
+
+
+def _decode(chunks):
+    decoder = OfferDecoder()
+    items = []
+    for chunk in chunks:
+        items.extend(decoder.feed(chunk))
+    items.extend(decoder.feed(b"", final=True))
+    return items, decoder.extras
+
+
+def _expected(document):
+    return document["data"], {k: v for k, v in document.items() if k != "data"}
+
+
+@pytest.mark.parametrize("document", DOCUMENTS)
+def test_byte_by_byte(document):
+    body = json.dumps(document, ensure_ascii=False).encode("utf-8")
+    assert _decode(body[i:i + 1] for i in range(len(body))) == _expected(document)
+
+
+@pytest.mark.parametrize("document", DOCUMENTS)
+def test_every_split_point(document):
+    body = json.dumps(document, ensure_ascii=False).encode("utf-8")
+    for split in range(len(body) + 1):
+        assert _decode([body[:split], body[split:]]) == _expected(document), split
+
+
+def test_number_split_at_exponent():
+    assert _decode([b'{"data":[1],"x":1', b"e", b"5}"]) == ([1], {"x": 1e5})
+    assert _decode([b'{"data":[1.', b"5]}"]) == ([1.5], {})
+
+
+@pytest.mark.parametrize("body", [
+    b'{"data":[{"id":"1"},{"id":',
+    b'{"data":[1,2',
+    b'{"data":[1],"x":1e',
+    b'{"data":[1]',
+    b'{"data":["\xc3',
+    b'[1, 2]',
+])
+def test_truncated_or_invalid_body(body):
+    with pytest.raises(StreamDecodeError):
+        _decode(body[i:i + 1] for i in range(len(body)))
+
+
+def test_stream_context_manager_releases_connection():
+    closed = []
+    body = json.dumps(DOCUMENTS[3]).encode("utf-8")
+
+    with OfferStream([body[:40], body[40:]], on_close=lambda: closed.append(True)) as offers:
+        assert next(iter(offers))["id"] == "1"
+        assert not closed
+    assert closed == [True]
+
+
+def test_stream_releases_connection_on_decode_error():
+    closed = []
+    offers = OfferStream([b'{"data":[1,', b"}"], on_close=lambda: closed.append(True))
+
+    with pytest.raises(StreamDecodeError):
+        list(offers)
+    assert closed == [True]
+
+
+def test_stream_carriers_keep_unread_offers():
+    body = json.dumps(DOCUMENTS[3]).encode("utf-8")
+    offers = OfferStream(body[i:i + 7] for i in range(0, len(body), 7))
+
+    assert offers.carriers == {"EY": "ETIHAD AIRWAYS"}
+    assert [offer["id"] for offer in offers] == ["1", "2"]
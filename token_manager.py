@@ -0,0 +1,190 @@
+import asyncio
+import threading
+import time
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Refresh this many seconds before the token actually expires
+REFRESH_MARGIN = 60
+# Used when the OAuth response does not carry expires_in
+DEFAULT_EXPIRES_IN = 1799
+
+
+class _TokenState:
+    """
+    Token + expiry bookkeeping shared by the sync and async managers.
+    Optionally mirrors the token into a TokenStore so other processes
+    using the same key can skip the auth round trip.
+    """
+
+    def __init__(self, refresh_margin: float, clock, store=None, store_key=None):
+        self.refresh_margin = refresh_margin
+        self._clock = clock
+        self.store = store
+        self.store_key = store_key
+
+        self.access_token = None
+        self.expires_at = 0.0
+
+    def is_valid(self) -> bool:
+        return bool(self.access_token) and self._clock() < self.expires_at
+
+    def needs_refresh(self) -> bool:
+        return self._clock() >= self.expires_at - self.refresh_margin
+
+    def set_token(self, access_token, expires_in) -> None:
+        self._set_in_memory(access_token, expires_in)
+        self._save_to_store()
+
+    def _set_in_memory(self, access_token, expires_in) -> None:
+        self.access_token = access_token
+        self.expires_at = self._clock() + float(expires_in or DEFAULT_EXPIRES_IN)
+
+    # Store I/O is SQLite: the async manager runs these in a worker thread
+    def _save_to_store(self) -> None:
+        if self.store is not None:
+            self.store.save(self.store_key, self.access_token, self.expires_at)
+
+    def _read_store(self):
+        return self.store.load(self.store_key) if self.store is not None else None
+
+    def _load_from_store(self, stale) -> bool:
+        return self._adopt_stored(self._read_store(), stale)
+
+    def _adopt_stored(self, stored, stale) -> bool:
+        """
+        Adopts a stored token if it is fresh and not the one being replaced.
+        """
+        if not stored:
+            return False
+
+        access_token, expires_at = stored
+        if access_token == stale or self._clock() >= expires_at - self.refresh_margin:
+            return False
+
+        self.access_token = access_token
+        self.expires_at = expires_at
+        return True
+
+
+class TokenManager(_TokenState):
+    """
+    Tracks an OAuth access token and its expiry.
+
+    - Valid token          → returned as-is
+    - Inside REFRESH_MARGIN → returned as-is, refreshed in a background thread
+    - Missing / expired     → refreshed inline
+
+    Refreshes are single-flight: concurrent callers wait on one lock and
+    reuse whatever token the first caller fetched, so a burst of parallel
+    searches never sends more than one token request.
+
+    fetch_token() must return (access_token, expires_in_seconds).
+    """
+
+    def __init__(self, fetch_token, refresh_margin: float = REFRESH_MARGIN, clock=time.time,
+                 store=None, store_key=None):
+        super().__init__(refresh_margin, clock, store, store_key)
+        self._fetch_token = fetch_token
+
+        self._lock = threading.Lock()
+        self._background_lock = threading.Lock()
+
+    def get_token(self):
+        """
+        Returns a usable access token, refreshing only when needed.
+        """
+        token = self.access_token
+
+        if self.is_valid():
+            if self.needs_refresh():
+                self._refresh_in_background(token)
+            return token
+
+        return self.refresh(stale=token)
+
+    def refresh(self, stale=None):
+        """
+        Fetches a new token unless another caller already replaced `stale`.
+        Pass the token that was rejected (e.g. on a 401) as `stale`.
+        """
+        with self._lock:
+            if self.is_valid() and self.access_token != stale:
+                return self.access_token
+
+            # Another process may already hold a fresh token for this key
+            if self._load_from_store(stale):
+                return self.access_token
+
+            access_token, expires_in = self._fetch_token()
+            self.set_token(access_token, expires_in)
+            return access_token
+
+    def _refresh_in_background(self, stale) -> None:
+        if not self._background_lock.acquire(blocking=False):
+            return  # a background refresh is already running
+
+        def run():
+            try:
+                self.refresh(stale=stale)
+            except Exception as e:
+                logger.warning(f"Background token refresh failed: {e}")
+            finally:
+                self._background_lock.release()
+
+        threading.Thread(target=run, daemon=True).start()
+
+
+class AsyncTokenManager(_TokenState):
+    """
+    asyncio counterpart of TokenManager.
+    fetch_token() is a coroutine returning (access_token, expires_in_seconds).
+    """
+
+    def __init__(self, fetch_token, refresh_margin: float = REFRESH_MARGIN, clock=time.time,
+                 store=None, store_key=None):
+        super().__init__(refresh_margin, clock, store, store_key)
+        self._fetch_token = fetch_token
+
+        self._lock = asyncio.Lock()
+        self._background_task = None
+
+    async def get_token(self):
+        token = self.access_token
+
+        if self.is_valid():
+            if self.needs_refresh():
+                self._refresh_in_background(token)
+            return token
+
+        return await self.refresh(stale=token)
+
+    async def refresh(self, stale=None):
+        async with self._lock:
+            if self.is_valid() and self.access_token != stale:
+                return self.access_token
+
+            # Token store reads/writes are SQLite (5 s busy timeout):
+            # keep them off the event loop
+            stored = await asyncio.to_thread(self._read_store)
+            if self._adopt_stored(stored, stale):
+                return self.access_token
+
+            access_token, expires_in = await self._fetch_token()
+            self._set_in_memory(access_token, expires_in)
+            await asyncio.to_thread(self._save_to_store)
+            return access_token
+
+    def _refresh_in_background(self, stale) -> None:
+        if self._background_task is not None and not self._background_task.done():
+            return
+
+        async def run():
+            try:
+                await self.refresh(stale=stale)
+            except Exception as e:
+                logger.warning(f"Background token refresh failed: {e}")
+
+        self._background_task = asyncio.get_running_loop().create_task(run())
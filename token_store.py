@@ -0,0 +1,91 @@
+import hashlib
+import os
+import sqlite3
+import time
+from contextlib import closing
+from typing import Optional, Tuple
+
+from utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+TOKEN_STORE_FILE = ".amadeus_token_cache.sqlite"
+
+
+class TokenStore:
+    """
+    SQLite-backed OAuth token cache shared across processes.
+
+    Rows are keyed by a hash of (api_key, token_url), so the raw key never
+    touches disk and test/production endpoints never share a token.
+    SQLite's own file locking (WAL + busy timeout) makes concurrent reads
+    and writes from cron runs, workers and CLI calls safe. The file holds
+    live bearer tokens, so it is created readable by the owner only.
+    """
+
+    def __init__(self, path: str = TOKEN_STORE_FILE, timeout: float = 5.0):
+        self.path = path
+        self.timeout = timeout
+        self._init_db()
+
+    @staticmethod
+    def key_for(api_key: str, token_url: str) -> str:
+        return hashlib.sha256(f"{api_key}|{token_url}".encode("utf-8")).hexdigest()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=self.timeout)
+
+    def _init_db(self) -> None:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        # Live bearer tokens: owner-only. SQLite gives the -wal/-shm files
+        # the same mode; the chmod also tightens files made before this.
+        os.close(os.open(self.path, os.O_CREAT | os.O_RDWR, 0o600))
+        os.chmod(self.path, 0o600)
+
+        with closing(self._connect()) as conn, conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS tokens ("
+                " key TEXT PRIMARY KEY,"
+                " access_token TEXT NOT NULL,"
+                " expires_at REAL NOT NULL)"
+            )
+
+    def load(self, key: str) -> Optional[Tuple[str, float]]:
+        """
+        Returns (access_token, expires_at) if a non-expired token is stored.
+        """
+        try:
+            with closing(self._connect()) as conn, conn:
+                row = conn.execute(
+                    "SELECT access_token, expires_at FROM tokens WHERE key = ?",
+                    (key,),
+                ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Token store read failed: {e}")
+            return None
+
+        if not row or row[1] <= time.time():
+            return None
+        return row[0], row[1]
+
+    def save(self, key: str, access_token: str, expires_at: float) -> None:
+        try:
+            with closing(self._connect()) as conn, conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO tokens (key, access_token, expires_at)"
+                    " VALUES (?, ?, ?)",
+                    (key, access_token, expires_at),
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"Token store write failed: {e}")
+
+    def delete(self, key: str) -> None:
+        try:
+            with closing(self._connect()) as conn, conn:
+                conn.execute("DELETE FROM tokens WHERE key = ?", (key,))
+        except sqlite3.Error as e:
+            logger.warning(f"Token store delete failed: {e}")